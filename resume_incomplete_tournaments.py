@@ -19,8 +19,11 @@ OUTPUT_DIR = Path("/home/aayush/Aayush/Learning/Courses/COL333_TA/A5/COL333_A5_E
 EVALUATION_DIR = Path("/home/aayush/Aayush/Learning/Courses/COL333_TA/A5/COL333_A5_Evaluation")
 TOURNAMENT_SCRIPT = EVALUATION_DIR / "run_tournament.py"
 
-# Base port - each group will use BASE_PORT + group_number
+# Each group gets its own PORT_RANGE-wide port window: run_tournament
+# spreads its matches over BASE_PORT..BASE_PORT+PORT_RANGE-1, so group
+# bases spaced any closer would collide between concurrent groups.
 BASE_PORT = 9500
+PORT_RANGE = 1024  # must match run_tournament.PORT_RANGE
 NUM_WORKERS = 32  # Number of groups to re-run
 
 # List of groups to re-run with improved timeout logic
@@ -49,7 +52,7 @@ def run_single_tournament(args):
     """Run tournament for a single group"""
     group_num, group_dir = args
     group_name = group_dir.name
-    port = BASE_PORT + group_num
+    port = BASE_PORT + (group_num - 1) * PORT_RANGE
     
     # FORCE RE-RUN: Skip completion check and always re-run
     print(f"🔄 FORCE re-running tournament for {group_name} on port {port}")
@@ -64,8 +67,8 @@ def run_single_tournament(args):
         
         # Replace the PORT value
         modified_content = original_content.replace(
-            "PORT = 9500",
-            f"PORT = {port}"
+            "BASE_PORT = 9500",
+            f"BASE_PORT = {port}"
         )
         
         # Write temporary script
@@ -164,7 +167,7 @@ def main():
     
     print(f"📁 Found {len(group_dirs)} incomplete groups to resume")
     print(f"💻 Using {NUM_WORKERS} CPU cores")
-    print(f"🔌 Port range: {BASE_PORT} to {BASE_PORT + 32}")
+    print(f"🔌 Port range: {BASE_PORT} to {BASE_PORT + 32 * PORT_RANGE - 1}")
     print()
     
     print(f"🚀 Starting {len(group_dirs)} tournaments in parallel...")
@@ -19,8 +19,11 @@ OUTPUT_DIR = Path("/home/aayush/Aayush/Learning/Courses/COL333_TA/A5/COL333_A5_E
 EVALUATION_DIR = Path("/home/aayush/Aayush/Learning/Courses/COL333_TA/A5/COL333_A5_Evaluation")
 TOURNAMENT_SCRIPT = EVALUATION_DIR / "run_tournament.py"
 
-# Base port - each group will use BASE_PORT + group_number
+# Each group gets its own PORT_RANGE-wide port window: run_tournament
+# spreads its matches over BASE_PORT..BASE_PORT+PORT_RANGE-1, so group
+# bases spaced any closer would collide between concurrent groups.
 BASE_PORT = 9500
+PORT_RANGE = 1024  # must match run_tournament.PORT_RANGE
 NUM_WORKERS = 32  # Use all 32 CPU cores
 
 def modify_tournament_script_for_port(group_num):
@@ -28,14 +31,14 @@ def modify_tournament_script_for_port(group_num):
     Create a modified version of run_tournament.py with a specific port for this group.
     This avoids port conflicts when running multiple tournaments in parallel.
     """
-    port = BASE_PORT + group_num
+    port = BASE_PORT + (group_num - 1) * PORT_RANGE
     return port
 
 def run_single_tournament(args):
     """Run tournament for a single group"""
     group_num, group_dir = args
     group_name = group_dir.name
-    port = BASE_PORT + group_num
+    port = BASE_PORT + (group_num - 1) * PORT_RANGE
     
     print(f"🚀 Starting tournament for {group_name} on port {port}")
     
@@ -49,8 +52,8 @@ def run_single_tournament(args):
         
         # Replace the PORT value
         modified_content = original_content.replace(
-            "PORT = 9500",
-            f"PORT = {port}"
+            "BASE_PORT = 9500",
+            f"BASE_PORT = {port}"
         )
         
         # Write temporary script
@@ -138,7 +141,7 @@ def main():
     
     print(f"📁 Found {len(group_dirs)} groups")
     print(f"💻 Using {NUM_WORKERS} CPU cores")
-    print(f"🔌 Port range: {BASE_PORT} to {BASE_PORT + len(group_dirs) - 1}")
+    print(f"🔌 Port range: {BASE_PORT} to {BASE_PORT + len(group_dirs) * PORT_RANGE - 1}")
     print()
     
     # Create output directory
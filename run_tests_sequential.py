@@ -4,6 +4,7 @@ Run all eligible submissions sequentially (one at a time).
 """
 
 import os
+import re
 import csv
 import time
 import subprocess
@@ -30,6 +31,28 @@ TIME_LIMITS = {
 # Python executable
 PYTHON_EXE = "/home/aayush/anaconda3/envs/Aayush_env/bin/python"
 
+# Invariant paths and file lists (same for every submission tested)
+TEMP_TESTS_DIR = os.path.join(EVALUATION_DIR, 'temp_tests')
+REFERENCE_FILES = ('gameEngine.py', 'agent.py', 'bot_client.py')
+WEB_SERVER_SRC = os.path.join(EVALUATION_DIR, 'manual_test', 'web_server.py')
+TEMPLATES_SRC = os.path.join(REFERENCE_DIR, 'templates')
+STUDENT_BOT = os.path.join(EVALUATION_DIR, 'test_bot_student.py')
+VS_BOT = os.path.join(EVALUATION_DIR, 'test_bot_vs_student.py')
+
+# Server logs can grow large (per-turn state for 1000+ turns), but the
+# decision signals ("Winner:", "Final Scores", repetition, errors) appear
+# near the end. Parse only the tail by default.
+LOG_TAIL_BYTES = 65536
+
+def read_log_tail(log_path, max_bytes=LOG_TAIL_BYTES):
+    """Read up to the last max_bytes of a log file."""
+    size = os.path.getsize(log_path)
+    with open(log_path, 'r', errors='replace') as f:
+        if size > max_bytes:
+            f.seek(size - max_bytes)
+            f.readline()  # Skip the (likely partial) first line
+        return f.read()
+
 def test_submission(folder_name, student_id, group_info):
     """Test a single submission against reference student agent."""
     print(f"\n{'='*80}")
@@ -40,26 +63,24 @@ def test_submission(folder_name, student_id, group_info):
     
     try:
         # Create test directory for this submission
-        test_dir = os.path.join(EVALUATION_DIR, 'temp_tests', folder_name)
+        test_dir = os.path.join(TEMP_TESTS_DIR, folder_name)
         os.makedirs(test_dir, exist_ok=True)
-        
+
         # Copy reference files
-        for file in ['gameEngine.py', 'agent.py', 'bot_client.py']:
+        for file in REFERENCE_FILES:
             src = os.path.join(REFERENCE_DIR, file)
             dst = os.path.join(test_dir, file)
             subprocess.run(['cp', src, dst], check=True, capture_output=True)
-        
+
         # Copy updated web_server.py with repetition detection from manual_test
-        web_server_src = os.path.join(EVALUATION_DIR, 'manual_test', 'web_server.py')
         web_server_dst = os.path.join(test_dir, 'web_server.py')
-        subprocess.run(['cp', web_server_src, web_server_dst], check=True, capture_output=True)
-        
+        subprocess.run(['cp', WEB_SERVER_SRC, web_server_dst], check=True, capture_output=True)
+
         # Copy templates directory
-        templates_src = os.path.join(REFERENCE_DIR, 'templates')
         templates_dst = os.path.join(test_dir, 'templates')
         if os.path.exists(templates_dst):
             subprocess.run(['rm', '-rf', templates_dst], check=True, capture_output=True)
-        subprocess.run(['cp', '-r', templates_src, templates_dst], check=True, capture_output=True)
+        subprocess.run(['cp', '-r', TEMPLATES_SRC, templates_dst], check=True, capture_output=True)
         
         # Copy all files from submission directory
         submission_dir = os.path.join(SUBMISSIONS_BASE, folder_name)
@@ -117,7 +138,7 @@ def test_submission(folder_name, student_id, group_info):
         student_log = os.path.join(test_dir, 'student_bot.log')
         with open(student_log, 'w') as log_file:
             student_proc = subprocess.Popen(
-                [PYTHON_EXE, os.path.join(EVALUATION_DIR, 'test_bot_student.py'), 
+                [PYTHON_EXE, STUDENT_BOT,
                  test_dir, str(PORT), board_size],
                 stdout=log_file,
                 stderr=subprocess.STDOUT,
@@ -131,7 +152,7 @@ def test_submission(folder_name, student_id, group_info):
         random_log = os.path.join(test_dir, 'random_bot.log')
         with open(random_log, 'w') as log_file:
             random_proc = subprocess.Popen(
-                [PYTHON_EXE, os.path.join(EVALUATION_DIR, 'test_bot_vs_student.py'), 
+                [PYTHON_EXE, VS_BOT,
                  test_dir, str(PORT), board_size, REFERENCE_STUDENT_AGENT],
                 stdout=log_file,
                 stderr=subprocess.STDOUT,
@@ -141,18 +162,33 @@ def test_submission(folder_name, student_id, group_info):
         print("Reference student bot (square) started")
         print(f"Game in progress... (timeout: {timeout_seconds}s)")
         
-        # Wait for game to complete or timeout
+        # Wait for game to complete or timeout. Tail the server log
+        # incrementally (the handle position is stateful, so each read only
+        # returns newly appended bytes) and stop as soon as the definitive
+        # result lines appear instead of waiting for both bots to exit.
         start_time = time.time()
         game_completed = False
-        
-        while time.time() - start_time < timeout_seconds:
-            # Check if both bots have finished (game complete)
-            if student_proc.poll() is not None and random_proc.poll() is not None:
-                game_completed = True
-                elapsed = time.time() - start_time
-                print(f"✅ Game completed in {elapsed:.1f} seconds")
-                break
-            time.sleep(2)
+        log_buffer = ''
+        log_fh = open(server_log, 'r', errors='replace')
+        try:
+            while time.time() - start_time < timeout_seconds:
+                log_buffer += log_fh.read()
+                if 'Winner:' in log_buffer and 'Final Scores' in log_buffer:
+                    game_completed = True
+                    elapsed = time.time() - start_time
+                    print(f"✅ Game decided in {elapsed:.1f} seconds (result in server log)")
+                    break
+                # Keep only the tail - signals always arrive together at the end
+                log_buffer = log_buffer[-LOG_TAIL_BYTES:]
+                # Check if both bots have finished (game complete)
+                if student_proc.poll() is not None and random_proc.poll() is not None:
+                    game_completed = True
+                    elapsed = time.time() - start_time
+                    print(f"✅ Game completed in {elapsed:.1f} seconds")
+                    break
+                time.sleep(0.5)
+        finally:
+            log_fh.close()
         
         if not game_completed:
             print(f"⏱️  TIMEOUT: Game did not complete within {timeout_seconds}s")
@@ -194,15 +230,71 @@ def test_submission(folder_name, student_id, group_info):
             'turns': ''
         }
 
+# Single alternation that picks out only the interesting log lines; the
+# regex engine does one C-level pass over the content instead of Python
+# running several substring tests on every line.
+_SERVER_LINE_RE = re.compile(
+    r'^(.*(?:Repetition/stalemate detected|Winner:|Final Scores|timeout|turn).*)$',
+    re.MULTILINE | re.IGNORECASE)
+_CIRCLE_SCORE_RE = re.compile(r'Circle:\s*([\d.]+)')
+_SQUARE_SCORE_RE = re.compile(r'Square:\s*([\d.]+)')
+_NUMBER_RE = re.compile(r'\d+')
+
+def scan_server_log(log_content):
+    """Scan server log content for winner, scores, turns and termination reason."""
+    winner = ''
+    player1_score = ''
+    player2_score = ''
+    turns = ''
+    reason = ''
+
+    for match in _SERVER_LINE_RE.finditer(log_content):
+        line = match.group(1)
+        lower = line.lower()
+
+        # Check for repetition (opponent wins)
+        if 'repetition/stalemate detected' in lower:
+            # Next line should have Winner info
+            reason = 'Repetition detected - opponent wins'
+
+        # Look for winner declaration (explicit or on a "Game finished" line)
+        if 'winner:' in lower:
+            if 'circle' in lower:
+                winner = 'student'
+            elif 'square' in lower:
+                winner = 'random'
+            # Check for timeout (opponent wins)
+            if 'timeout' in lower and winner:
+                reason = 'Opponent timeout'
+
+        # Look for scores - format: "Final Scores - Circle: X.XX, Square: Y.YY"
+        if 'final scores' in lower:
+            # Extract circle and square scores
+            circle_match = _CIRCLE_SCORE_RE.search(line)
+            square_match = _SQUARE_SCORE_RE.search(line)
+            if circle_match:
+                player1_score = circle_match.group(1)
+            if square_match:
+                player2_score = square_match.group(1)
+
+        # Look for turns
+        if 'turn' in lower and 'turn_count' not in lower:
+            turn_nums = _NUMBER_RE.findall(line)
+            if turn_nums:
+                turns = turn_nums[-1]
+
+    return winner, player1_score, player2_score, turns, reason
+
 def parse_game_result(server_log, student_log, random_log, folder_name, student_id):
     """Parse game result from logs."""
     try:
-        # Check for errors in student bot
-        with open(student_log, 'r') as f:
-            student_content = f.read()
-        
-        if 'error' in student_content.lower() or 'exception' in student_content.lower() or 'traceback' in student_content.lower():
-            error_lines = [line for line in student_content.split('\n') 
+        # Check for errors in student bot (signals are near the end of the log)
+        student_content = read_log_tail(student_log)
+        # Lowercase once - every signal test below reads the same text
+        student_lower = student_content.lower()
+
+        if 'error' in student_lower or 'exception' in student_lower or 'traceback' in student_lower:
+            error_lines = [line for line in student_content.split('\n')
                           if 'error' in line.lower() or 'exception' in line.lower()]
             error_msg = error_lines[0] if error_lines else 'Student bot error'
             return {
@@ -216,71 +308,19 @@ def parse_game_result(server_log, student_log, random_log, folder_name, student_
                 'turns': ''
             }
         
-        # Check server log for game completion
-        with open(server_log, 'r') as f:
-            log_content = f.read()
-        
-        import re
-        winner = ''
-        player1_score = ''
-        player2_score = ''
-        turns = ''
-        reason = ''
-        
-        lines = log_content.split('\n')
-        for line in lines:
-            # Check for repetition (opponent wins)
-            if 'Repetition/stalemate detected' in line:
-                # Next line should have Winner info
-                reason = 'Repetition detected - opponent wins'
-            
-            # Look for explicit winner declaration
-            if 'Winner:' in line:
-                if 'circle' in line.lower():
-                    winner = 'student'
-                elif 'square' in line.lower():
-                    winner = 'random'
-            
-            # Look for game finished with winner
-            if 'Game finished' in line and 'Winner:' in line:
-                if 'circle' in line.lower():
-                    winner = 'student'
-                elif 'square' in line.lower():
-                    winner = 'random'
-            
-            # Check for timeout (opponent wins)
-            if 'timeout' in line.lower() and 'winner' in line.lower():
-                if 'circle' in line.lower():
-                    winner = 'student'
-                    reason = 'Opponent timeout'
-                elif 'square' in line.lower():
-                    winner = 'random'
-                    reason = 'Opponent timeout'
-            
-            # Look for scores - format: "Final Scores - Circle: X.XX, Square: Y.YY"
-            if 'Final Scores' in line:
-                # Extract circle and square scores
-                circle_match = re.search(r'Circle:\s*([\d.]+)', line)
-                square_match = re.search(r'Square:\s*([\d.]+)', line)
-                if circle_match:
-                    player1_score = circle_match.group(1)
-                if square_match:
-                    player2_score = square_match.group(1)
-            
-            # Look for turns
-            if 'turn' in line.lower() and 'turn_count' not in line.lower():
-                turn_nums = re.findall(r'\d+', line)
-                if turn_nums:
-                    turns = turn_nums[-1]
-        
+        # Check server log for game completion - scan the tail first, fall
+        # back to the full file only if no signal was found there (rare)
+        winner, player1_score, player2_score, turns, reason = scan_server_log(read_log_tail(server_log))
+        if not winner and os.path.getsize(server_log) > LOG_TAIL_BYTES:
+            with open(server_log, 'r', errors='replace') as f:
+                winner, player1_score, player2_score, turns, reason = scan_server_log(f.read())
         # Check for invalid move in student bot log (opponent wins)
-        with open(random_log, 'r') as f:
-            random_content = f.read()
-        
-        if 'invalid_move' in student_content.lower() or 'invalid move' in student_content.lower():
+        random_lower = read_log_tail(random_log).lower()
+
+        if 'invalid_move' in student_lower or 'invalid move' in student_lower:
             winner = 'random'
             reason = 'Student made invalid move'
-        elif 'invalid_move' in random_content.lower() or 'invalid move' in random_content.lower():
+        elif 'invalid_move' in random_lower or 'invalid move' in random_lower:
             winner = 'student'
             reason = 'Opponent made invalid move'
         
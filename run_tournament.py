@@ -10,15 +10,62 @@ import sys
 import subprocess
 import time
 import csv
+import hashlib
+import json
+import mmap
+import traceback
 from datetime import datetime
 import shutil
 import signal
+import socket
+import threading
+import uuid
+import atexit
 from pathlib import Path
 import re
 from itertools import combinations
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
 # Configuration
-PORT = 9500
+# Each match is assigned its own block of ports (see match_port) so that
+# concurrently running matches never collide on the listening socket and
+# every game within a match gets a fresh port - no game waits for the
+# previous server's socket to leave TIME_WAIT
+BASE_PORT = 9500
+PORT_RANGE = 1024
+PORTS_PER_MATCH = 4  # enough for 3 boards (standard) or 2 games (T1)
+
+
+def match_port(match_num):
+    """Base listening port for a match - distinct per concurrent match.
+
+    Games within the match use port, port+1, ... up to PORTS_PER_MATCH.
+    Wraps within PORT_RANGE so very large groups can't walk past the
+    valid port space; in-flight matches are bounded by the worker pool,
+    which is far smaller than the range.
+    """
+    return BASE_PORT + (((match_num - 1) * PORTS_PER_MATCH) % PORT_RANGE)
+
+# Console verbosity: 0 = quiet (errors and final summary only),
+# 1 = match-level progress (default), 2 = per-game detail + tracebacks.
+# Overridable via TOURNAMENT_VERBOSE or the -q/--quiet CLI flag.
+VERBOSITY = int(os.environ.get('TOURNAMENT_VERBOSE', '1') or 1)
+
+_stdout_write = sys.stdout.write
+
+
+def log(msg, level=1):
+    """Print msg when the verbosity level admits it.
+
+    The per-game chatter (~15 lines per match) goes to level 2 so quiet
+    runs skip both the f-string builds and the stdout writes.
+    """
+    if VERBOSITY >= level:
+        _stdout_write(msg + '\n')
+
+# Number of matches to run concurrently. Each match spawns a server and
+# two player processes, so leave headroom on the core count.
+MAX_PARALLEL_MATCHES = max(1, (os.cpu_count() or 4) // 4)
 
 # TOURNAMENT CONFIGURATION
 # Tournament 1 (T1): Only small board, each match played twice (role swap)
@@ -29,6 +76,45 @@ if TOURNAMENT_MODE == "T1":
 else:
     BOARD_SIZES = ['small', 'medium', 'large']
 
+# Per-board result-key tuples, built once at import so the summary loops
+# don't rebuild and re-hash f-string keys for every row
+T1_BOARD_KEYS = {
+    b: (f'{b}_game1_winner', f'{b}_game1_player1_score', f'{b}_game1_player2_score', f'{b}_game1_error',
+        f'{b}_game2_winner', f'{b}_game2_player1_score', f'{b}_game2_player2_score', f'{b}_game2_error',
+        f'{b}_overall_winner', f'{b}_player1_total_score', f'{b}_player2_total_score')
+    for b in BOARD_SIZES
+}
+STANDARD_BOARD_KEYS = {
+    b: (f'{b}_winner', f'{b}_player1_score', f'{b}_player2_score', f'{b}_error')
+    for b in BOARD_SIZES
+}
+
+# Keys for display-ready total-score strings preformatted by run_match
+# (not CSV columns; the summary writer reads them to skip re-formatting)
+T1_SCORE_STR_KEYS = {
+    b: (f'{b}_p1_total_str', f'{b}_p2_total_str')
+    for b in BOARD_SIZES
+}
+
+# CSV column layouts per tournament mode, assembled once at import from
+# the same per-board key tuples. Tuples keep DictWriter's per-row
+# fieldname validation walking a fixed, immutable sequence.
+_COMMON_CSV_FIELDS = ('match_num', 'player1', 'player2', 'player1_id', 'player2_id')
+T1_CSV_FIELDS = _COMMON_CSV_FIELDS + tuple(
+    key for b in BOARD_SIZES for key in T1_BOARD_KEYS[b]) + ('timestamp',)
+STANDARD_CSV_FIELDS = _COMMON_CSV_FIELDS + tuple(
+    key for b in BOARD_SIZES for key in STANDARD_BOARD_KEYS[b]) + ('timestamp',)
+
+# Python executable from the evaluation conda env - invoking it directly
+# avoids spawning bash + sourcing conda's init script for every subprocess
+CONDA_PYTHON = "/home/aayush/anaconda3/envs/Aayush_env/bin/python"
+# Child environment built once: the env's bin dir leads PATH so anything
+# the submissions shell out to resolves the same binaries that
+# `conda activate` used to provide
+CHILD_ENV = {**os.environ,
+             'PATH': f"{os.path.dirname(CONDA_PYTHON)}:{os.environ.get('PATH', '')}"}
+SERVER_ENV = {**CHILD_ENV, 'DISPLAY': ''}  # headless - no GUI
+
 # Time limits per player (as per assignment requirements)
 # Server enforces these limits internally
 SERVER_TIME_LIMITS = {
@@ -47,8 +133,180 @@ TIME_LIMITS = {
     'large': 900    # 20 minutes (enough for 360s per player + turn limit gameplay)
 }
 
+# Patterns used by parse_game_result, compiled once at import instead of
+# on every call (re.search with a literal recompiles per invocation)
+# Log patterns are bytes-mode: parse_game_result scans the mmap'd log
+# pages directly, skipping the str copy and UTF-8 decode of the file
+SCORE_RE = re.compile(rb'Final Scores - Circle:\s*(\d+\.?\d*),\s*Square:\s*(\d+\.?\d*)', re.IGNORECASE)
+WINNER_RE = re.compile(rb'Winner:\s*(\w+)', re.IGNORECASE)
+# Error signatures collapsed into a single alternation so the fallback
+# scan makes one pass over the log instead of one search per signature
+ERROR_RE = re.compile(
+    rb'ImportError|ModuleNotFoundError|AttributeError|TypeError|ValueError|'
+    rb'IndexError|KeyError|NameError|SyntaxError|IndentationError|Traceback|'
+    rb'ConnectionRefusedError|TimeoutError|Connection refused',
+    re.IGNORECASE)
+# Every terminal game event in one alternation - parse_game_result scans
+# each log once and dispatches on the named group instead of running a
+# separate substring search per event
+EVENT_RE = re.compile(
+    rb"(?P<timeout>timeout)"
+    rb"|(?P<repetition>repetition)"
+    rb"|(?P<invalid>invalid move(?: by (?P<side>circle|square))?)"
+    rb"|(?P<turnlim>turn limit|1000 total turns)"
+    rb"|(?P<finish>game finished|game over|winner:)",
+    re.IGNORECASE)
+
+# Board-size display labels, computed once instead of calling
+# .capitalize()/.upper() per row of every summary
+BOARD_LABELS = {b: b.capitalize() for b in BOARD_SIZES}
+BOARD_UPPER = {b: b.upper() for b in BOARD_SIZES}
+
+# Summary-tally dispatch: winner value -> (player1 counter, player2
+# counter) to bump, replacing a per-row if/elif chain; anything not in
+# the table falls through to the error handling
+T1_OUTCOMES = {
+    'player1': ('wins', 'losses'),
+    'player2': ('losses', 'wins'),
+    'draw': ('draws', 'draws'),
+}
+STANDARD_OUTCOMES = {
+    'circle': ('wins', 'losses'),
+    'square': ('losses', 'wins'),
+    'draw': ('draws', 'draws'),
+}
+
+# Row templates for match summaries. Binding .format once gives the
+# repeated rows one precompiled template instead of re-parsing the same
+# width specs for every field of every row.
+_T1_ROW_FMT = "{:<10} {:<8} {:<10} {:<10} {:<12} {:<12} {:<12} {:<20}\n".format
+_STD_ROW_FMT = "{:<15} {:<15} {:<15} {:<15} {:<20}\n".format
+
+def _trunc(s, limit=18, keep=15):
+    """Truncate s with an ellipsis when longer than limit.
+
+    The common case (status 'OK' or 'Completed') returns the string
+    untouched with no slicing or concatenation.
+    """
+    return s if len(s) <= limit else s[:keep] + '...'
+
+
+# Directory trees queued for background deletion (see discard_tree)
+_trash_threads = []
+
+
+def discard_tree(path):
+    """Remove a directory tree without blocking the caller.
+
+    The tree is atomically renamed out of the way, then deleted by a
+    background thread - a stale CMake build dir can hold thousands of
+    artifacts and take a second to rmtree synchronously.
+    """
+    trash = Path(path).parent / f'.trash.{uuid.uuid4().hex}'
+    os.rename(path, trash)
+    t = threading.Thread(target=shutil.rmtree, args=(trash,),
+                         kwargs={'ignore_errors': True}, daemon=True)
+    t.start()
+    _trash_threads.append(t)
+
+
+@atexit.register
+def _drain_trash_threads():
+    for t in _trash_threads:
+        t.join(timeout=10)
+
+
+def terminate_group(proc, proc_name):
+    """Tear down a game subprocess's whole process group.
+
+    SIGTERM first so the children get a chance to clean up, SIGKILL if
+    they have not exited after five seconds. Signalling the group (each
+    child starts with start_new_session=True) takes out any helpers the
+    submission spawned as well.
+    """
+    try:
+        if proc.poll() is None:  # Still running
+            os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
+            try:
+                proc.wait(timeout=5)  # Give 5 seconds for graceful shutdown
+                log(f"         ✓ {proc_name} terminated gracefully", 2)
+            except subprocess.TimeoutExpired:
+                # Force kill if terminate doesn't work
+                os.killpg(os.getpgid(proc.pid), signal.SIGKILL)
+                proc.wait(timeout=2)
+                log(f"         ⚠️  {proc_name} force killed", 2)
+        else:
+            log(f"         ✓ {proc_name} already finished", 2)
+    except Exception as e:
+        log(f"         ❌ Error killing {proc_name}: {e}", 2)
+
+
+def link_file(src, dst):
+    """Hard-link a single file into place (falls back to copying)"""
+    if os.path.exists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def link_tree(src, dst):
+    """Replicate src at dst using hard links (falls back to copying).
+    
+    Matches only need a read-only view of the submission sources, so
+    linking turns the per-match "copy" into a metadata-only operation.
+    """
+    os.makedirs(dst, exist_ok=True)
+    for root, dirs, files in os.walk(src):
+        rel = os.path.relpath(root, src)
+        target_root = os.path.join(dst, rel) if rel != '.' else str(dst)
+        for d in dirs:
+            os.makedirs(os.path.join(target_root, d), exist_ok=True)
+        for name in files:
+            link_file(os.path.join(root, name), os.path.join(target_root, name))
+
+
+# Every field the log parse needs appears in the last few KB of a log,
+# so scan a tail window first and only rescan the whole file if that
+# window turns out to be inconclusive
+LOG_TAIL_BYTES = 1 << 16
+
+
+def load_log_bytes(path, tail=None):
+    """Map a log file read-only as raw bytes.
+
+    Searching the mapped pages avoids copying the whole file into a
+    Python str and decoding it - the scan reads straight from the page
+    cache. With `tail` set, only (roughly) the last `tail` bytes are
+    mapped. Zero-length files (which mmap rejects) come back as b''.
+    """
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return b''
+        offset = 0
+        if tail is not None and size > tail:
+            # mmap offsets must be allocation-granularity aligned
+            offset = (size - tail) & ~(mmap.ALLOCATIONGRANULARITY - 1)
+        return mmap.mmap(f.fileno(), size - offset, access=mmap.ACCESS_READ, offset=offset)
+
+
 class TournamentRunner:
-    def __init__(self, group_dir, output_dir):
+    # Reference-file locations, computed once at class definition instead
+    # of per match (and shared with forked workers)
+    EVAL_DIR = Path(__file__).parent
+    MANUAL_TEST_DIR = EVAL_DIR / 'manual_test'
+    # Files that should be in manual_test directory
+    MANUAL_TEST_FILES = ('gameEngine.py', 'agent.py', 'bot_client.py', 'web_server.py')
+    # Files that are in evaluation root directory
+    EVAL_ROOT_FILES = ('test_bot_student.py', 'test_bot_vs_student.py')
+    # Engine files each player directory needs on its import path
+    PLAYER_IMPORT_FILES = ('gameEngine.py', 'agent.py')
+
+    def __init__(self, group_dir, output_dir, max_workers=MAX_PARALLEL_MATCHES, use_cache=True):
+        self.max_workers = max_workers
+        self.use_cache = use_cache
         self.group_dir = Path(group_dir)
         self.group_name = self.group_dir.name
         # Create group-specific output directory
@@ -63,6 +321,34 @@ class TournamentRunner:
         # CSV file for results
         self.csv_file = self.output_dir / f'{self.group_name}_results.csv'
         
+        # Compiled C++ artifacts cached by source hash - in a round-robin
+        # each submission would otherwise be rebuilt once per opponent
+        self.build_cache_dir = self.output_dir / 'build_cache'
+        self.build_cache_dir.mkdir(exist_ok=True)
+
+        # Finished game results cached on disk so incremental re-runs
+        # (e.g. after adding one submission) skip games already played
+        self.results_cache_dir = self.output_dir / 'results_cache'
+        self.results_cache_dir.mkdir(exist_ok=True)
+
+        # pybind11's cmake dir is a constant - resolved lazily on the
+        # first C++ compile and reused for every one after that
+        self._pybind11_dir = None
+
+        # Submission contents are stable for the whole tournament, so
+        # the type scan result is cached per directory (a round-robin
+        # would otherwise re-scan each submission once per opponent)
+        self._type_cache = {}
+
+        # Standings tallies, maintained incrementally as match rows are
+        # recorded (and recovered rows re-read on resume) so the final
+        # summary doesn't have to re-parse the whole CSV
+        self.player_scores = {
+            sub.name: {'wins': 0, 'losses': 0, 'draws': 0, 'errors': 0, 'total_score': 0}
+            for sub in self.submissions
+        }
+        self._scores_live = False
+        
         print(f"🏆 Tournament for {self.group_name}")
         print(f"📁 Group directory: {self.group_dir}")
         print(f"📊 Output directory: {self.output_dir}")
@@ -72,43 +358,141 @@ class TournamentRunner:
         print()
     
     def detect_submission_type(self, submission_dir):
-        """Detect if submission is Python, C++, or mixed"""
-        has_cmake = (submission_dir / 'CMakeLists.txt').exists()
-        has_cpp = any(submission_dir.glob('*.cpp'))
-        has_py = any(submission_dir.glob('*.py'))
-        
+        """Detect if submission is Python, C++, or mixed (memoized)"""
+        key = os.path.realpath(submission_dir)
+        cached = self._type_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # One scandir pass instead of a stat plus two glob listings
+        has_cmake = has_cpp = has_py = False
+        with os.scandir(submission_dir) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                name = entry.name
+                if name == 'CMakeLists.txt':
+                    has_cmake = True
+                elif name.endswith('.cpp'):
+                    has_cpp = True
+                elif name.endswith('.py'):
+                    has_py = True
+                if has_cmake and has_cpp and has_py:
+                    break
+
         if has_cmake or has_cpp:
-            return 'mixed' if has_py else 'cpp'
-        return 'python'
+            sub_type = 'mixed' if has_py else 'cpp'
+        else:
+            sub_type = 'python'
+        self._type_cache[key] = sub_type
+        return sub_type
+    
+    def hash_submission_sources(self, submission_dir):
+        """Content hash over a submission's C++ sources (build cache key)"""
+        # blake2b is the fastest hash in the stdlib (no extra dependency
+        # needed) and collision resistance well beyond what a cache key
+        # requires; stream files in chunks so large sources aren't read
+        # into memory whole
+        h = hashlib.blake2b(digest_size=20)
+        # Walk the whole submission tree - sources often live under
+        # subdirectories (src/, include/), and two submissions sharing a
+        # boilerplate top-level CMakeLists.txt must not hash alike. The
+        # relative path goes into the digest too so moving a file is a
+        # change; build/ output is skipped so compiling doesn't shift
+        # the key.
+        files = []
+        for pattern in ('CMakeLists.txt', '*.cpp', '*.h', '*.hpp'):
+            for path in submission_dir.rglob(pattern):
+                rel = path.relative_to(submission_dir)
+                if 'build' in rel.parts:
+                    continue
+                files.append((rel.as_posix(), path))
+        for rel, path in sorted(files):
+            h.update(rel.encode())
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    h.update(chunk)
+        return h.hexdigest()
+    
+    def ensure_built(self, player_dir):
+        """Compile a C++ submission, reusing the cached .so when the same
+        sources were already built for an earlier match"""
+        digest = self.hash_submission_sources(player_dir)
+        cache_dir = self.build_cache_dir / digest
+        cached_sos = list(cache_dir.glob('*.so')) if cache_dir.exists() else []
+        build_dir = player_dir / 'build'
+        
+        if cached_sos:
+            build_dir.mkdir(exist_ok=True)
+            for so_file in cached_sos:
+                link_file(so_file, build_dir / so_file.name)
+            return True, f"Reused cached build ({digest[:12]})"
+
+        success, message = self.compile_cpp_submission(player_dir, player_dir)
+        if success:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            for so_file in build_dir.glob('*.so'):
+                link_file(so_file, cache_dir / so_file.name)
+        return success, message
     
+    def precompile_submissions(self):
+        """Warm the build cache once per unique C++ submission.
+
+        Run before the match pool starts: otherwise parallel workers
+        meeting the same opponent for the first time compile identical
+        sources concurrently. After this pass every match is a cache hit.
+        """
+        prebuild_root = self.output_dir / 'prebuild'
+        for submission in self.submissions:
+            if self.detect_submission_type(submission) not in ['cpp', 'mixed']:
+                continue
+            scratch = prebuild_root / submission.name
+            link_tree(submission, scratch)
+            log(f"🔨 Prebuilding {submission.name}...")
+            success, message = self.ensure_built(scratch)
+            if success:
+                log(f"   ✅ {submission.name}: {message}")
+            else:
+                log(f"   ⚠️  {submission.name}: {message}")
+        if prebuild_root.exists():
+            # The scratch trees were only needed to produce the cache
+            discard_tree(prebuild_root)
+
+    def get_pybind11_cmakedir(self):
+        """Resolve pybind11's cmake directory once per process.
+
+        Spawning a python interpreter just to print this constant path
+        cost ~500ms on every C++ compile; now each compile after the
+        first reads the cached value.
+        """
+        if self._pybind11_dir is None:
+            result = subprocess.run(
+                [CONDA_PYTHON, '-m', 'pybind11', '--cmakedir'],
+                capture_output=True,
+                text=True,
+                timeout=10
+            )
+            if result.returncode == 0:
+                self._pybind11_dir = result.stdout.strip()
+        return self._pybind11_dir
+
     def compile_cpp_submission(self, submission_dir, temp_dir):
         """Compile C++ submission if needed"""
         if not (submission_dir / 'CMakeLists.txt').exists():
             return False, "No CMakeLists.txt found"
         
-        # Python executable from Aayush_env
-        python_exe = "/home/aayush/anaconda3/envs/Aayush_env/bin/python"
         
         build_dir = temp_dir / 'build'
-        # Remove old build directory if exists
+        # Move any old build directory aside and delete it in the background
         if build_dir.exists():
-            shutil.rmtree(build_dir)
+            discard_tree(build_dir)
         build_dir.mkdir(exist_ok=True)
         
         try:
-            # Get pybind11 cmake directory
-            pybind11_result = subprocess.run(
-                [python_exe, '-m', 'pybind11', '--cmakedir'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            if pybind11_result.returncode != 0:
+            pybind11_dir = self.get_pybind11_cmakedir()
+            if not pybind11_dir:
                 return False, "Could not find pybind11 cmake directory"
-            
-            pybind11_dir = pybind11_result.stdout.strip()
-            
+
             # Configure CMake with pybind11
             # Use GCC-10 for better C++20 support
             result = subprocess.run(
@@ -117,7 +501,11 @@ class TournamentRunner:
                     f'-Dpybind11_DIR={pybind11_dir}',
                     '-DCMAKE_BUILD_TYPE=Release',
                     '-DCMAKE_C_COMPILER=gcc-10',
-                    '-DCMAKE_CXX_COMPILER=g++-10'
+                    '-DCMAKE_CXX_COMPILER=g++-10',
+                    # Batch translation units so multi-file submissions
+                    # compile as a handful of jumbo units
+                    '-DCMAKE_UNITY_BUILD=ON',
+                    '-DCMAKE_UNITY_BUILD_BATCH_SIZE=8'
                 ],
                 cwd=build_dir,
                 capture_output=True,
@@ -129,9 +517,9 @@ class TournamentRunner:
                 error_msg = result.stderr[-500:] if result.stderr else "CMake configure failed"
                 return False, f"CMake configure failed: {error_msg}"
             
-            # Build with CMake
+            # Build with CMake, using all cores
             result = subprocess.run(
-                ['cmake', '--build', '.', '--config', 'Release'],
+                ['cmake', '--build', '.', '--config', 'Release', '--parallel', str(os.cpu_count() or 1)],
                 cwd=build_dir,
                 capture_output=True,
                 text=True,
@@ -161,96 +549,86 @@ class TournamentRunner:
         """Copy necessary files for a match"""
         match_dir.mkdir(parents=True, exist_ok=True)
         
-        # Reference files to copy
-        eval_dir = Path(__file__).parent
-        manual_test_dir = eval_dir / 'manual_test'
-        
-        # Files that should be in manual_test directory
-        manual_test_files = ['gameEngine.py', 'agent.py', 'bot_client.py', 'web_server.py']
-        
-        # Files that are in evaluation root directory
-        eval_root_files = ['test_bot_student.py', 'test_bot_vs_student.py']
-        
-        # Copy files from manual_test directory
-        for file in manual_test_files:
-            src = manual_test_dir / file
+        # Link files from manual_test directory
+        for file in self.MANUAL_TEST_FILES:
+            src = self.MANUAL_TEST_DIR / file
             if src.exists():
-                shutil.copy2(src, match_dir)
-        
-        # Copy files from evaluation root directory
-        for file in eval_root_files:
-            src = eval_dir / file
+                link_file(src, match_dir / file)
+
+        # Link files from evaluation root directory
+        for file in self.EVAL_ROOT_FILES:
+            src = self.EVAL_DIR / file
             if src.exists():
-                shutil.copy2(src, match_dir)
-        
-        # Copy templates directory from manual_test
-        templates_src = manual_test_dir / 'templates'
+                link_file(src, match_dir / file)
+
+        # Link templates directory from manual_test - the assets are
+        # read-only, so hard links replace the old rmtree + full copy
+        # per match (link_tree is idempotent, no teardown needed)
+        templates_src = self.MANUAL_TEST_DIR / 'templates'
         if templates_src.exists():
-            templates_dst = match_dir / 'templates'
-            if templates_dst.exists():
-                shutil.rmtree(templates_dst)
-            shutil.copytree(templates_src, templates_dst)
+            link_tree(templates_src, match_dir / 'templates')
         
         # Setup player directories
         player1_temp = match_dir / 'player1'
         player2_temp = match_dir / 'player2'
         
-        # Copy all files from player1
+        # Link all files from player1
         if player1_temp.exists():
             shutil.rmtree(player1_temp)
-        shutil.copytree(player1_dir, player1_temp)
+        link_tree(player1_dir, player1_temp)
         
-        # Copy all files from player2
+        # Link all files from player2
         if player2_temp.exists():
             shutil.rmtree(player2_temp)
-        shutil.copytree(player2_dir, player2_temp)
+        link_tree(player2_dir, player2_temp)
         
-        # Copy gameEngine.py and agent.py to each player directory so they can import it
+        # Link gameEngine.py and agent.py to each player directory so they can import it
         for player_dir in [player1_temp, player2_temp]:
-            for file in ['gameEngine.py', 'agent.py']:
-                src = manual_test_dir / file
+            for file in self.PLAYER_IMPORT_FILES:
+                src = self.MANUAL_TEST_DIR / file
                 if src.exists():
-                    shutil.copy2(src, player_dir)
+                    link_file(src, player_dir / file)
         
         # Compile C++ submissions if needed
         for player_dir, player_name in [(player1_temp, 'Player1'), (player2_temp, 'Player2')]:
             submission_type = self.detect_submission_type(player_dir)
             if submission_type in ['cpp', 'mixed']:
-                print(f"         🔨 Compiling {player_name} C++ submission...")
-                success, message = self.compile_cpp_submission(player_dir, player_dir)
+                log(f"         🔨 Compiling {player_name} C++ submission...", 2)
+                success, message = self.ensure_built(player_dir)
                 if success:
-                    print(f"         ✅ {player_name} compilation successful")
+                    log(f"         ✅ {player_name} compilation successful", 2)
                 else:
-                    print(f"         ⚠️  {player_name} compilation warning: {message}")
+                    log(f"         ⚠️  {player_name} compilation warning: {message}", 2)
         
         return player1_temp, player2_temp
     
-    def parse_game_result(self, log_file, server_log_file=None):
-        """Parse game result from log file (prefer server log, fallback to player log)"""
-        # First check server log if available
-        logs_to_check = []
-        if server_log_file and server_log_file.exists():
-            logs_to_check.append(('server', server_log_file))
-        if log_file.exists():
-            logs_to_check.append(('player', log_file))
-        
-        if not logs_to_check:
-            return None, None, None, "No log files found"
-        
+    def _scan_logs(self, logs_to_check):
+        """Run the terminal-event scan over the given log buffers.
+
+        Returns (winner, circle_score, square_score, termination_reason);
+        everything is None when no terminal event was found.
+        """
         winner = None
         circle_score = None
         square_score = None
-        error = None
         termination_reason = None
-        
-        for log_type, log_path in logs_to_check:
-            with open(log_path, 'r') as f:
-                content = f.read()
-            
+
+        for log_type, log_path, content in logs_to_check:
+            # One pass over the log collects every terminal event; the
+            # priority checks below consult the dict instead of running
+            # a separate substring scan per event
+            events = {}
+            for event_match in EVENT_RE.finditer(content):
+                name = event_match.lastgroup
+                if name == 'side':
+                    name = 'invalid'
+                if name not in events:
+                    events[name] = event_match
+            score_match = SCORE_RE.search(content)
+
             # Check for timeout - but don't report as error if game completed with valid winner
-            if 'Timeout' in content or 'timeout' in content or 'TIMEOUT' in content:
+            if 'timeout' in events:
                 # Try to extract scores even on timeout
-                score_match = re.search(r'Final Scores - Circle:\s*(\d+\.?\d*),\s*Square:\s*(\d+\.?\d*)', content, re.IGNORECASE)
                 if score_match:
                     circle_score = float(score_match.group(1))
                     square_score = float(score_match.group(2))
@@ -263,44 +641,42 @@ class TournamentRunner:
                     termination_reason = "Timeout (no scores)"
             
             # Check for repetition (3-move repetition detected)
-            if 'REPETITION DETECTED' in content or 'repetition' in content.lower():
+            if 'repetition' in events:
                 termination_reason = "Repetition (3-move rule)"
                 # Extract winner from server log
-                winner_match = re.search(r'Winner:\s*(\w+)', content, re.IGNORECASE)
+                winner_match = WINNER_RE.search(content)
                 if winner_match:
-                    winner = winner_match.group(1).lower()
-                
+                    winner = winner_match.group(1).decode().lower()
+
                 # Extract scores from server log
-                score_match = re.search(r'Final Scores - Circle:\s*(\d+\.?\d*),\s*Square:\s*(\d+\.?\d*)', content, re.IGNORECASE)
                 if score_match:
                     circle_score = float(score_match.group(1))
                     square_score = float(score_match.group(2))
                     break
             
             # Check for invalid move
-            if 'INVALID MOVE' in content or 'invalid move' in content.lower():
+            if 'invalid' in events:
                 termination_reason = "Invalid move"
-                # Check who made invalid move
-                if 'INVALID MOVE by circle' in content:
+                # Check who made invalid move (captured by the event scan)
+                side = events['invalid'].group('side')
+                if side and side.lower() == b'circle':
                     winner = 'square'
                     circle_score = 0.0
                     square_score = 100.0
-                elif 'INVALID MOVE by square' in content:
+                elif side and side.lower() == b'square':
                     winner = 'circle'
                     circle_score = 100.0
                     square_score = 0.0
-                
+
                 # Try to get scores from server log
-                score_match = re.search(r'Final Scores - Circle:\s*(\d+\.?\d*),\s*Square:\s*(\d+\.?\d*)', content, re.IGNORECASE)
                 if score_match:
                     circle_score = float(score_match.group(1))
                     square_score = float(score_match.group(2))
                 break
             
             # Check for turn limit (1000 turns)
-            if 'Turn limit' in content or 'turn limit' in content.lower() or '1000 total turns' in content:
+            if 'turnlim' in events:
                 termination_reason = "Turn limit (1000 turns)"
-                score_match = re.search(r'Final Scores - Circle:\s*(\d+\.?\d*),\s*Square:\s*(\d+\.?\d*)', content, re.IGNORECASE)
                 if score_match:
                     circle_score = float(score_match.group(1))
                     square_score = float(score_match.group(2))
@@ -308,15 +684,14 @@ class TournamentRunner:
                     break
             
             # Check for normal completion (win condition or game finished)
-            if 'Game finished' in content or 'Game Over' in content or 'Winner:' in content:
+            if 'finish' in events:
                 # Try to extract winner
                 if not winner:
-                    winner_match = re.search(r'Winner:\s*(\w+)', content, re.IGNORECASE)
+                    winner_match = WINNER_RE.search(content)
                     if winner_match:
-                        winner = winner_match.group(1).lower()
+                        winner = winner_match.group(1).decode().lower()
                 
                 # Extract scores from server log or player log
-                score_match = re.search(r'Final Scores - Circle:\s*(\d+\.?\d*),\s*Square:\s*(\d+\.?\d*)', content, re.IGNORECASE)
                 if score_match:
                     circle_score = float(score_match.group(1))
                     square_score = float(score_match.group(2))
@@ -324,71 +699,91 @@ class TournamentRunner:
                         winner = 'circle' if circle_score > square_score else 'square' if square_score > circle_score else 'draw'
                     termination_reason = "Normal (win condition met)" if winner and winner != 'draw' else "Normal (completed)"
                     break
+
+        return winner, circle_score, square_score, termination_reason
+
+    def parse_game_result(self, log_file, server_log_file=None):
+        """Parse game result from log file (prefer server log, fallback to player log)"""
+        # First check server log if available. Map each log exactly once -
+        # the main scan, the error-pattern fallback and the last-resort
+        # check below all reuse the same mapping instead of re-opening
+        # (and re-decoding) the files per phase.
+        def load_logs(tail):
+            logs = []
+            for log_type, path in (('server', server_log_file), ('player', log_file)):
+                if path is None:
+                    continue
+                try:
+                    # Open directly - a missing log is the exceptional
+                    # case, so skip the .exists() stat per file
+                    logs.append((log_type, path, load_log_bytes(path, tail)))
+                except FileNotFoundError:
+                    continue
+            return logs
+
+        # Fast path: scan only the tail windows. Multi-MB logs put every
+        # terminal marker (scores, winner, termination cause) at the end.
+        logs_to_check = load_logs(LOG_TAIL_BYTES)
+
+        if not logs_to_check:
+            return None, None, None, "No log files found"
+
+        winner, circle_score, square_score, termination_reason = self._scan_logs(logs_to_check)
+
+        if not winner and not termination_reason:
+            # Inconclusive tail - rescan the full files once before
+            # falling through to the error checks (no-op when the tail
+            # windows already covered the whole files)
+            full_logs = load_logs(None)
+            if any(len(full) > len(tail)
+                   for (_, _, full), (_, _, tail) in zip(full_logs, logs_to_check)):
+                logs_to_check = full_logs
+                winner, circle_score, square_score, termination_reason = self._scan_logs(logs_to_check)
+
+        error = None
         
         # If still no result, check for errors
         if not winner and not termination_reason:
             # Look for common error patterns in both logs
-            for log_type, log_path in logs_to_check:
-                with open(log_path, 'r') as f:
-                    content = f.read()
-                
-                error_patterns = [
-                    (r'ImportError', 'Import Error'),
-                    (r'ModuleNotFoundError', 'Module Not Found'),
-                    (r'AttributeError', 'Attribute Error'),
-                    (r'TypeError', 'Type Error'),
-                    (r'ValueError', 'Value Error'),
-                    (r'IndexError', 'Index Error'),
-                    (r'KeyError', 'Key Error'),
-                    (r'NameError', 'Name Error'),
-                    (r'SyntaxError', 'Syntax Error'),
-                    (r'IndentationError', 'Indentation Error'),
-                    (r'Traceback', 'Python Exception'),
-                    (r'ConnectionRefusedError', 'Connection Refused'),
-                    (r'TimeoutError', 'Timeout Error'),
-                    (r'Connection refused', 'Connection Refused'),
-                ]
-                
-                for pattern, error_name in error_patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        error = error_name
-                        # Try to get more specific error message
-                        lines = content.split('\n')
-                        for line in lines:
-                            if re.search(pattern, line, re.IGNORECASE):
-                                error = line.strip()[:200]  # First 200 chars of error line
-                                break
-                        termination_reason = f"Error: {error}"
-                        break
-                
-                if error:
+            for log_type, log_path, content in logs_to_check:
+                match = ERROR_RE.search(content)
+                if match:
+                    # Slice the matching line straight out of the
+                    # content via the match position instead of
+                    # re-running the pattern over every line
+                    line_start = content.rfind(b'\n', 0, match.start()) + 1
+                    line_end = content.find(b'\n', match.end())
+                    if line_end == -1:
+                        line_end = len(content)
+                    line = bytes(content[line_start:line_end]).strip()
+                    error = (line[:200] if line else match.group(0)).decode(errors='replace')
+                    termination_reason = f"Error: {error}"
                     break
             
             if not error:
                 # Last resort - check if log is empty or incomplete
-                for log_type, log_path in logs_to_check:
-                    with open(log_path, 'r') as f:
-                        content = f.read()
-                    
-                    if len(content.strip()) < 50:
+                for log_type, log_path, content in logs_to_check:
+                    # Materialize as bytes: mmap objects lack strip/in
+                    data = bytes(content)
+                    if len(data.strip()) < 50:
                         error = "Log too short - process may have crashed"
                         termination_reason = "Error: Process crashed"
                     else:
                         # Check if game actually finished
-                        if '✅ Bot finished' in content or 'Game finished' in content:
+                        if '✅ Bot finished'.encode() in data or b'Game finished' in data:
                             # Game finished but no clear result - could be repetition
                             termination_reason = "Completed (check server log for details)"
                             # Try one more time to find winner from any log
-                            score_match = re.search(r'Final Scores - Circle:\s*(\d+\.?\d*),\s*Square:\s*(\d+\.?\d*)', content, re.IGNORECASE)
+                            score_match = SCORE_RE.search(content)
                             if score_match:
                                 circle_score = float(score_match.group(1))
                                 square_score = float(score_match.group(2))
                                 winner = 'circle' if circle_score > square_score else 'square' if square_score > circle_score else 'draw'
                         else:
                             # Get last non-empty line as context
-                            lines = [l.strip() for l in content.split('\n') if l.strip()]
+                            lines = [l.strip() for l in data.split(b'\n') if l.strip()]
                             if lines:
-                                error = f"Game did not complete. Last log: {lines[-1][:150]}"
+                                error = f"Game did not complete. Last log: {lines[-1][:150].decode(errors='replace')}"
                                 termination_reason = "Incomplete"
                             else:
                                 error = "Unknown error - game did not complete"
@@ -404,7 +799,7 @@ class TournamentRunner:
         
         return winner, circle_score, square_score, final_error
     
-    def run_game(self, match_dir, player1_temp, player2_temp, board_size, log_prefix):
+    def run_game(self, match_dir, player1_temp, player2_temp, board_size, log_prefix, port):
         """Run a single game on specified board size
         
         Args:
@@ -413,6 +808,7 @@ class TournamentRunner:
             player2_temp: Directory for player2 (will play as Square)
             board_size: 'small', 'medium', or 'large'
             log_prefix: Prefix for log files
+            port: Port for this match's web server (unique per match)
         
         Note: 
         - Web server runs in headless mode (no GUI) - only API endpoints are used
@@ -420,141 +816,173 @@ class TournamentRunner:
         - Latency compensation is built into web_server.py via thinking_time parameter
         - On timeout, server automatically declares opponent as winner and computes final scores
         """
-        print(f"      🎮 Running {board_size} board game (log_prefix={log_prefix})...")
-        print(f"         Board size: {board_size}")
-        print(f"         Time limit per player: {SERVER_TIME_LIMITS[board_size]}s")
-        print(f"         External watchdog: {TIME_LIMITS[board_size]}s")
-        print(f"         Match dir: {match_dir}")
-        print(f"         Player1 (Circle): {player1_temp.name}")
-        print(f"         Player2 (Square): {player2_temp.name}")
-        
-        # Commands using conda environment with unbuffered output (-u flag)
-        conda_python = 'bash -c "source ~/anaconda3/etc/profile.d/conda.sh && conda activate Aayush_env && python -u'
+        log(f"      🎮 Running {board_size} board game (log_prefix={log_prefix})...", 2)
+        log(f"         Board size: {board_size}", 2)
+        log(f"         Time limit per player: {SERVER_TIME_LIMITS[board_size]}s", 2)
+        log(f"         External watchdog: {TIME_LIMITS[board_size]}s", 2)
+        log(f"         Match dir: {match_dir}", 2)
+        log(f"         Player1 (Circle): {player1_temp.name}", 2)
+        log(f"         Player2 (Square): {player2_temp.name}", 2)
         
         # Start web server in headless mode (no GUI, only API)
         # Pass board size explicitly to ensure correct configuration
         server_log = match_dir / f'{log_prefix}_server.log'
         with open(server_log, 'w') as f:
             server_proc = subprocess.Popen(
-                f'{conda_python} web_server.py {PORT} {board_size}"',
+                [CONDA_PYTHON, '-u', 'web_server.py', str(port), board_size],
                 cwd=match_dir,
                 stdout=f,
                 stderr=subprocess.STDOUT,
-                shell=True,
-                env={**os.environ, 'DISPLAY': ''}  # Disable display for headless mode
+                start_new_session=True,  # Own process group for clean teardown
+                env=SERVER_ENV
             )
         
-        time.sleep(2)  # Wait for server to start
-        
+        # Probe the port until the server accepts connections instead of
+        # sleeping a fixed 2s - ready immediately on a fast machine and
+        # still covered on a loaded one (up to ~10s). A dead server ends
+        # the probe early; the connection wait below reports the failure.
+        for _ in range(200):
+            if server_proc.poll() is not None:
+                break
+            try:
+                socket.create_connection(('127.0.0.1', port), timeout=0.1).close()
+                break
+            except OSError:
+                time.sleep(0.05)
+
         # Start player1 (circle) - runs player1's submission
         # Use relative paths so Python can find the student_agent module
         player1_log = match_dir / f'{log_prefix}_player1.log'
         with open(player1_log, 'w') as f:
             player1_proc = subprocess.Popen(
-                f'{conda_python} test_bot_student.py player1 {PORT} {board_size} circle"',
+                [CONDA_PYTHON, '-u', 'test_bot_student.py', 'player1', str(port), board_size, 'circle'],
                 cwd=match_dir,
                 stdout=f,
                 stderr=subprocess.STDOUT,
-                shell=True
+                start_new_session=True,  # Own process group for clean teardown
+                env=CHILD_ENV
             )
         
-        time.sleep(1)
-        
         # Start player2 (square) - runs player2's submission
         # Use relative paths so Python can find the student_agent module
         player2_log = match_dir / f'{log_prefix}_player2.log'
         with open(player2_log, 'w') as f:
             player2_proc = subprocess.Popen(
-                f'{conda_python} test_bot_student.py player2 {PORT} {board_size} square"',
+                [CONDA_PYTHON, '-u', 'test_bot_student.py', 'player2', str(port), board_size, 'square'],
                 cwd=match_dir,
                 stdout=f,
                 stderr=subprocess.STDOUT,
-                shell=True
+                start_new_session=True,  # Own process group for clean teardown
+                env=CHILD_ENV
             )
         
         # Wait for both players to connect (check server log for connection messages)
-        print(f"         ⏳ Waiting for players to connect...")
+        log(f"         ⏳ Waiting for players to connect...", 2)
         connection_timeout = 30  # 30 seconds to connect
         connection_start = time.time()
         both_connected = False
         
-        while time.time() - connection_start < connection_timeout:
-            if server_log.exists():
-                with open(server_log, 'r') as f:
-                    log_content = f.read()
-                    if 'both players connected' in log_content.lower() or 'game' in log_content.lower() and 'started' in log_content.lower():
+        # Tail the server log with one persistent handle - each poll reads
+        # only the newly appended bytes (the handle position is stateful)
+        # instead of reopening and rescanning the whole file every 500ms.
+        # The buffer is trimmed to a small window so the substring search
+        # stays O(bytes appended) even if the server is chatty; the
+        # children run with -u, so their lines land without extra delay.
+        # Reading in binary skips decoding bytes we only substring-search.
+        log_tail = b''
+        log_fh = open(server_log, 'rb')
+        try:
+            while time.time() - connection_start < connection_timeout:
+                chunk = log_fh.read()
+                if chunk:
+                    log_tail = (log_tail + chunk.lower())[-4096:]
+                    if b'both players connected' in log_tail or b'game' in log_tail and b'started' in log_tail:
                         both_connected = True
-                        print(f"         ✅ Both players connected")
+                        log(f"         ✅ Both players connected", 2)
                         break
-            time.sleep(0.5)
+                if server_proc.poll() is not None:
+                    # Server died before the players connected - no point
+                    # burning the rest of the connection window
+                    log(f"         ⚠️  Server exited during connection wait", 2)
+                    break
+                time.sleep(0.1)
+        finally:
+            log_fh.close()
         
         if not both_connected:
-            print(f"         ⚠️  Players did not connect within {connection_timeout}s, starting timeout anyway")
-        
-        # NOW start the external watchdog timeout (server has its own internal timeout)
-        # External timeout = server thinking time + buffer for server to write final scores
-        timeout_seconds = TIME_LIMITS[board_size]
-        server_timeout = SERVER_TIME_LIMITS[board_size]
-        start_time = time.time()
-        print(f"         ⏱️  External watchdog started: {timeout_seconds}s (server timeout: {server_timeout}s + 30s buffer)")
-        
-        while time.time() - start_time < timeout_seconds:
-            if server_proc.poll() is not None:
-                print(f"         ✅ Server process completed naturally, waiting 2s for logs to flush...")
-                time.sleep(2)  # Brief wait to ensure logs are fully written
-                break
-            time.sleep(2)
-        else:
-            # Timeout reached - give server 5 seconds to finish writing logs
-            print(f"         ⏰ External timeout reached, allowing server to finish writing...")
-            time.sleep(5)
-        
-        # Kill all processes gracefully, giving them time to finish I/O
-        for proc_name, proc in [("server", server_proc), ("player1", player1_proc), ("player2", player2_proc)]:
-            try:
-                if proc.poll() is None:  # Still running
-                    # Try to terminate gracefully first (allows cleanup)
-                    proc.terminate()
+            log(f"         ⚠️  Players did not connect within {connection_timeout}s, starting timeout anyway", 2)
+
+        # Short-circuit submissions that crash on startup (ImportError,
+        # missing .so, etc.) - without this a broken bot would hold the
+        # full watchdog timeout before the match is declared dead
+        startup_crash = None
+        if not both_connected:
+            for proc_name, proc in [("player1", player1_proc), ("player2", player2_proc)]:
+                rc = proc.poll()
+                if rc is not None and rc != 0:
+                    startup_crash = f"{proc_name} crashed at startup (rc={rc})"
+                    log(f"         ❌ {startup_crash}, forfeiting game", 2)
+                    break
+
+        if startup_crash is None:
+            # NOW start the external watchdog timeout (server has its own internal timeout)
+            # External timeout = server thinking time + buffer for server to write final scores
+            timeout_seconds = TIME_LIMITS[board_size]
+            server_timeout = SERVER_TIME_LIMITS[board_size]
+            log(f"         ⏱️  External watchdog started: {timeout_seconds}s (server timeout: {server_timeout}s + 30s buffer)", 2)
+
+            # Block on the server process in bounded slices - wait() returns
+            # the moment the server exits, and between slices we check for a
+            # player that died mid-game so its match aborts early too
+            deadline = time.time() + timeout_seconds
+            server_exited = False
+            while time.time() < deadline:
+                try:
+                    server_proc.wait(timeout=min(10, max(0.1, deadline - time.time())))
+                    server_exited = True
+                    break
+                except subprocess.TimeoutExpired:
+                    dead_players = [p for p in (player1_proc, player2_proc)
+                                    if p.poll() is not None]
+                    if len(dead_players) == 2:
+                        # Both players gone while the server lingers - the
+                        # game cannot progress, give the server a moment to
+                        # write final state and stop waiting
+                        log(f"         ⚠️  Both players exited, ending watchdog early", 2)
+                        try:
+                            server_proc.wait(timeout=5)
+                            server_exited = True
+                        except subprocess.TimeoutExpired:
+                            pass
+                        break
+
+            if server_exited:
+                log(f"         ✅ Server process completed naturally, waiting for players to exit...", 2)
+                # Players flush their logs on exit (-u output is unbuffered),
+                # so wait on them instead of sleeping a fixed 2s
+                for proc in (player1_proc, player2_proc):
                     try:
-                        proc.wait(timeout=5)  # Give 5 seconds for graceful shutdown
-                        print(f"         ✓ {proc_name} terminated gracefully")
+                        proc.wait(timeout=5)
                     except subprocess.TimeoutExpired:
-                        # Force kill if terminate doesn't work
-                        proc.kill()
-                        proc.wait(timeout=2)
-                        print(f"         ⚠️  {proc_name} force killed")
-                else:
-                    print(f"         ✓ {proc_name} already finished")
-            except Exception as e:
-                print(f"         ❌ Error killing {proc_name}: {e}")
-                pass
-        
-        # Aggressively kill any remaining processes for this board
-        try:
-            # Kill web server
-            subprocess.run(
-                ['pkill', '-9', '-f', f'web_server.py.*{PORT}.*{board_size}'],
-                capture_output=True,
-                timeout=2
-            )
-            # Kill test bots
-            subprocess.run(
-                ['pkill', '-9', '-f', f'test_bot_student.py.*{PORT}.*{board_size}'],
-                capture_output=True,
-                timeout=2
-            )
-            # Kill any python processes with the port
-            subprocess.run(
-                ['pkill', '-9', '-f', f'python.*{PORT}'],
-                capture_output=True,
-                timeout=2
-            )
-        except:
-            pass
-        
-        # Wait for processes to fully terminate and port to be released
-        time.sleep(4)
+                        pass
+            else:
+                # Timeout reached - give the server a bounded chance to finish
+                # writing final scores rather than sleeping unconditionally
+                log(f"         ⏰ External timeout reached, allowing server to finish writing...", 2)
+                try:
+                    server_proc.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    pass
+
+        # Kill each process group gracefully, then
+        # forcefully. Signalling the group replaces the old pkill sweeps,
+        # which raced against concurrent matches on other ports.
+        for proc_name, proc in [("server", server_proc), ("player1", player1_proc), ("player2", player2_proc)]:
+            terminate_group(proc, proc_name)
         
+        if startup_crash:
+            return None, None, None, startup_crash
+
         # Parse result from server log (preferred) or player1 log (fallback)
         winner, circle_score, square_score, error = self.parse_game_result(player1_log, server_log)
         
@@ -562,178 +990,200 @@ class TournamentRunner:
             result_msg = f"{board_size}: Winner = {winner}, Scores = {circle_score}-{square_score}"
             if error:
                 result_msg += f" ({error})"
-            print(f"         ✅ {result_msg}")
+            log(f"         ✅ {result_msg}", 2)
         else:
-            print(f"         ⚠️  {board_size}: {error}")
+            log(f"         ⚠️  {board_size}: {error}", 2)
         
         return winner, circle_score, square_score, error
     
+    def run_game_cached(self, match_dir, player1_temp, player2_temp, board_size, log_prefix, port, player1_id, player2_id):
+        """run_game with an on-disk result cache.
+
+        Finished games are stored as small JSON files keyed by the pair,
+        board, role order and tournament mode, so re-running a
+        tournament (after adding a submission, or resuming a crash)
+        replays only the games that are missing or previously errored.
+        """
+        key = f'{player1_id}|{player2_id}|{board_size}|{log_prefix}|{TOURNAMENT_MODE}'
+        cache_path = self.results_cache_dir / f'{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}.json'
+
+        if self.use_cache and cache_path.exists():
+            try:
+                with open(cache_path, 'r') as f:
+                    cached = json.load(f)
+                if cached.get('winner'):
+                    log(f"         ♻️  Using cached result for {log_prefix}", 2)
+                    return cached['winner'], cached['circle_score'], cached['square_score'], cached['error']
+            except (json.JSONDecodeError, KeyError):
+                pass  # Corrupt cache entry - replay the game
+
+        winner, circle_score, square_score, error = self.run_game(
+            match_dir, player1_temp, player2_temp, board_size, log_prefix, port
+        )
+
+        if self.use_cache and winner:
+            # Write atomically so a crash never leaves a torn entry
+            tmp_path = cache_path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump({'winner': winner, 'circle_score': circle_score,
+                           'square_score': square_score, 'error': error}, f)
+            os.replace(tmp_path, cache_path)
+
+        return winner, circle_score, square_score, error
+
     def create_match_summary(self, match_dir, results):
         """Create a comprehensive match summary file"""
         summary_file = match_dir / 'match_summary.txt'
         
-        with open(summary_file, 'w') as f:
-            f.write("=" * 80 + "\n")
-            f.write(f"MATCH SUMMARY - Match {results['match_num']}\n")
-            if TOURNAMENT_MODE == "T1":
-                f.write(f"Tournament Mode: T1 (Small board only, role swap)\n")
-            f.write("=" * 80 + "\n\n")
-            
-            f.write(f"Player 1: {results['player1']} (ID: {results['player1_id']})\n")
-            f.write(f"Player 2: {results['player2']} (ID: {results['player2_id']})\n")
-            f.write(f"Timestamp: {results.get('timestamp', 'N/A')}\n\n")
-            
-            total_p1_wins = 0
-            total_p2_wins = 0
-            total_draws = 0
-            total_errors = 0
+        # Accumulate the report in memory and emit it with one write -
+        # dozens of tiny f.write calls become a single buffered syscall.
+        # Bind append locally; it's called for every block below.
+        parts = []
+        append = parts.append
+        append("=" * 80 + "\n")
+        append(f"MATCH SUMMARY - Match {results['match_num']}\n")
+        if TOURNAMENT_MODE == "T1":
+            append(f"Tournament Mode: T1 (Small board only, role swap)\n")
+        append("=" * 80 + "\n\n")
+        
+        append(f"Player 1: {results['player1']} (ID: {results['player1_id']})\n")
+        append(f"Player 2: {results['player2']} (ID: {results['player2_id']})\n")
+        append(f"Timestamp: {results.get('timestamp', 'N/A')}\n\n")
+        
+        # Tallies computed by run_match at the moment winners were known
+        total_p1_wins = results.get('p1_wins', 0)
+        total_p2_wins = results.get('p2_wins', 0)
+        total_draws = results.get('draws', 0)
+        total_errors = results.get('errors', 0)
+        
+        if TOURNAMENT_MODE == "T1":
+            # T1 Mode: Show both games with role swap
+            append(
+                "-" * 100 + "\n"
+                + _T1_ROW_FMT('Board', 'Game', 'P1 Role', 'P2 Role', 'Winner', 'P1 Score', 'P2 Score', 'Status')
+                + "-" * 100 + "\n")
             
-            if TOURNAMENT_MODE == "T1":
-                # T1 Mode: Show both games with role swap
-                f.write("-" * 100 + "\n")
-                f.write(f"{'Board':<10} {'Game':<8} {'P1 Role':<10} {'P2 Role':<10} {'Winner':<12} {'P1 Score':<12} {'P2 Score':<12} {'Status':<20}\n")
-                f.write("-" * 100 + "\n")
-                
-                for board_size in BOARD_SIZES:
-                    # Game 1: P1=Circle, P2=Square
-                    winner_g1 = results.get(f'{board_size}_game1_winner', 'error')
-                    p1_score_g1 = results.get(f'{board_size}_game1_player1_score', '')
-                    p2_score_g1 = results.get(f'{board_size}_game1_player2_score', '')
-                    error_g1 = results.get(f'{board_size}_game1_error', '')
-                    
-                    # Game 2: P1=Square, P2=Circle
-                    winner_g2 = results.get(f'{board_size}_game2_winner', 'error')
-                    p1_score_g2 = results.get(f'{board_size}_game2_player1_score', '')
-                    p2_score_g2 = results.get(f'{board_size}_game2_player2_score', '')
-                    error_g2 = results.get(f'{board_size}_game2_error', '')
-                    
-                    # Overall
-                    overall_winner = results.get(f'{board_size}_overall_winner', 'N/A')
-                    p1_total = results.get(f'{board_size}_player1_total_score', '')
-                    p2_total = results.get(f'{board_size}_player2_total_score', '')
-                    
-                    # Count wins
-                    if winner_g1 == 'circle':  # P1 wins game 1
-                        total_p1_wins += 1
-                    elif winner_g1 == 'square':  # P2 wins game 1
-                        total_p2_wins += 1
-                    elif winner_g1 == 'draw':
-                        total_draws += 1
-                    else:
-                        total_errors += 1
-                    
-                    if winner_g2 == 'square':  # P1 wins game 2
-                        total_p1_wins += 1
-                    elif winner_g2 == 'circle':  # P2 wins game 2
-                        total_p2_wins += 1
-                    elif winner_g2 == 'draw':
-                        total_draws += 1
-                    else:
-                        total_errors += 1
-                    
-                    # Format scores
-                    p1_score_g1_str = f"{p1_score_g1:.1f}" if p1_score_g1 != '' else 'N/A'
-                    p2_score_g1_str = f"{p2_score_g1:.1f}" if p2_score_g1 != '' else 'N/A'
-                    p1_score_g2_str = f"{p1_score_g2:.1f}" if p1_score_g2 != '' else 'N/A'
-                    p2_score_g2_str = f"{p2_score_g2:.1f}" if p2_score_g2 != '' else 'N/A'
-                    p1_total_str = f"{p1_total:.1f}" if p1_total != '' else 'N/A'
-                    p2_total_str = f"{p2_total:.1f}" if p2_total != '' else 'N/A'
-                    
-                    # Status
-                    status_g1 = error_g1 if error_g1 else 'OK'
-                    status_g2 = error_g2 if error_g2 else 'OK'
-                    if len(status_g1) > 18:
-                        status_g1 = status_g1[:15] + "..."
-                    if len(status_g2) > 18:
-                        status_g2 = status_g2[:15] + "..."
-                    
-                    # Print Game 1
-                    f.write(f"{board_size.capitalize():<10} {'Game 1':<8} {'Circle':<10} {'Square':<10} {winner_g1.capitalize():<12} {p1_score_g1_str:<12} {p2_score_g1_str:<12} {status_g1:<20}\n")
-                    # Print Game 2
-                    f.write(f"{'':<10} {'Game 2':<8} {'Square':<10} {'Circle':<10} {winner_g2.capitalize():<12} {p1_score_g2_str:<12} {p2_score_g2_str:<12} {status_g2:<20}\n")
-                    # Print Overall
-                    f.write(f"{'':<10} {'Overall':<8} {'':<10} {'':<10} {overall_winner.upper():<12} {p1_total_str:<12} {p2_total_str:<12} {'':<20}\n")
-                    f.write("-" * 100 + "\n")
-                
-            else:
-                # Standard Mode: Single game per board
-                f.write("-" * 80 + "\n")
-                f.write(f"{'Board Size':<15} {'Winner':<15} {'Circle Score':<15} {'Square Score':<15} {'Status':<20}\n")
-                f.write("-" * 80 + "\n")
-                
-                for board_size in BOARD_SIZES:
-                    winner = results.get(f'{board_size}_winner', 'error')
-                    p1_score = results.get(f'{board_size}_player1_score', '')
-                    p2_score = results.get(f'{board_size}_player2_score', '')
-                    error_msg = results.get(f'{board_size}_error', '')
-                    
-                    # Count results
-                    if winner == 'circle':
-                        total_p1_wins += 1
-                    elif winner == 'square':
-                        total_p2_wins += 1
-                    elif winner == 'draw':
-                        total_draws += 1
-                    else:
-                        total_errors += 1
-                    
-                    # Format scores
-                    score_str_circle = f"{p1_score:.1f}" if p1_score != '' else 'N/A'
-                    score_str_square = f"{p2_score:.1f}" if p2_score != '' else 'N/A'
-                    
-                    # Status message (truncate if too long)
-                    status = error_msg if error_msg else 'Completed'
-                    if len(status) > 35:
-                        status = status[:32] + "..."
-                    
-                    f.write(f"{board_size.capitalize():<15} {winner.capitalize():<15} {score_str_circle:<15} {score_str_square:<15} {status:<20}\n")
+            for board_size in BOARD_SIZES:
+                (w1_key, s11_key, s12_key, e1_key,
+                 w2_key, s21_key, s22_key, e2_key,
+                 ow_key, t1_key, t2_key) = T1_BOARD_KEYS[board_size]
+
+                # Game 1: P1=Circle, P2=Square
+                winner_g1 = results.get(w1_key, 'error')
+                p1_score_g1 = results.get(s11_key, '')
+                p2_score_g1 = results.get(s12_key, '')
+                error_g1 = results.get(e1_key, '')
+
+                # Game 2: P1=Square, P2=Circle
+                winner_g2 = results.get(w2_key, 'error')
+                p1_score_g2 = results.get(s21_key, '')
+                p2_score_g2 = results.get(s22_key, '')
+                error_g2 = results.get(e2_key, '')
+
+                # Overall
+                overall_winner = results.get(ow_key, 'N/A')
+                p1_total = results.get(t1_key, '')
+                p2_total = results.get(t2_key, '')
                 
-                f.write("-" * 80 + "\n\n")
-            
-            # Overall match result
-            f.write("MATCH RESULT:\n")
-            f.write(f"  Player 1 (Circle) wins: {total_p1_wins}\n")
-            f.write(f"  Player 2 (Square) wins: {total_p2_wins}\n")
-            f.write(f"  Draws: {total_draws}\n")
-            f.write(f"  Errors: {total_errors}\n\n")
-            
-            if total_p1_wins > total_p2_wins:
-                f.write(f"🏆 OVERALL WINNER: Player 1 - {results['player1']}\n")
-            elif total_p2_wins > total_p1_wins:
-                f.write(f"🏆 OVERALL WINNER: Player 2 - {results['player2']}\n")
-            else:
-                f.write(f"🤝 MATCH TIED\n")
+                # Format scores once with inline conditionals
+                p1_score_g1_str = f"{p1_score_g1:.1f}" if p1_score_g1 != '' else 'N/A'
+                p2_score_g1_str = f"{p2_score_g1:.1f}" if p2_score_g1 != '' else 'N/A'
+                p1_score_g2_str = f"{p1_score_g2:.1f}" if p1_score_g2 != '' else 'N/A'
+                p2_score_g2_str = f"{p2_score_g2:.1f}" if p2_score_g2 != '' else 'N/A'
+                p1_str_key, p2_str_key = T1_SCORE_STR_KEYS[board_size]
+                p1_total_str = results.get(p1_str_key) or (f"{p1_total:.1f}" if p1_total != '' else 'N/A')
+                p2_total_str = results.get(p2_str_key) or (f"{p2_total:.1f}" if p2_total != '' else 'N/A')
+
+                # Status (truncated to fit the column)
+                status_g1 = _trunc(error_g1 or 'OK')
+                status_g2 = _trunc(error_g2 or 'OK')
+
+                # Game 1, Game 2, overall and divider as one append
+                append(
+                    _T1_ROW_FMT(BOARD_LABELS[board_size], 'Game 1', 'Circle', 'Square', winner_g1.capitalize(), p1_score_g1_str, p2_score_g1_str, status_g1)
+                    + _T1_ROW_FMT('', 'Game 2', 'Square', 'Circle', winner_g2.capitalize(), p1_score_g2_str, p2_score_g2_str, status_g2)
+                    + _T1_ROW_FMT('', 'Overall', '', '', overall_winner.upper(), p1_total_str, p2_total_str, '')
+                    + "-" * 100 + "\n")
             
-            f.write("\n" + "=" * 80 + "\n")
-            f.write("DETAILED RESULTS BY BOARD SIZE\n")
-            f.write("=" * 80 + "\n\n")
+        else:
+            # Standard Mode: Single game per board
+            append(
+                "-" * 80 + "\n"
+                + _STD_ROW_FMT('Board Size', 'Winner', 'Circle Score', 'Square Score', 'Status')
+                + "-" * 80 + "\n")
             
-            # Detailed results for each board
             for board_size in BOARD_SIZES:
-                winner = results.get(f'{board_size}_winner', 'error')
-                p1_score = results.get(f'{board_size}_player1_score', '')
-                p2_score = results.get(f'{board_size}_player2_score', '')
-                error_msg = results.get(f'{board_size}_error', '')
-                
-                f.write(f"{board_size.upper()} BOARD:\n")
-                f.write(f"  Winner: {winner.capitalize()}\n")
-                f.write(f"  Circle Score: {p1_score if p1_score != '' else 'N/A'}\n")
-                f.write(f"  Square Score: {p2_score if p2_score != '' else 'N/A'}\n")
-                
-                if error_msg:
-                    f.write(f"  Termination: {error_msg}\n")
+                winner_key, p1_key, p2_key, error_key = STANDARD_BOARD_KEYS[board_size]
+                winner = results.get(winner_key, 'error')
+                p1_score = results.get(p1_key, '')
+                p2_score = results.get(p2_key, '')
+                error_msg = results.get(error_key, '')
+
+                # Format scores
+                score_str_circle = f"{p1_score:.1f}" if p1_score != '' else 'N/A'
+                score_str_square = f"{p2_score:.1f}" if p2_score != '' else 'N/A'
                 
-                f.write(f"  Logs:\n")
-                f.write(f"    - Server: {board_size}_server.log\n")
-                f.write(f"    - Player 1: {board_size}_player1.log\n")
-                f.write(f"    - Player 2: {board_size}_player2.log\n")
-                f.write("\n")
+                # Status message (truncate if too long)
+                status = _trunc(error_msg or 'Completed', limit=35, keep=32)
+
+                append(_STD_ROW_FMT(BOARD_LABELS[board_size], winner.capitalize(), score_str_circle, score_str_square, status))
             
-            f.write("=" * 80 + "\n")
+            append("-" * 80 + "\n\n")
         
-        print(f"      📄 Match summary saved to: {summary_file.name}")
+        # Overall match result
+        if total_p1_wins > total_p2_wins:
+            verdict = f"🏆 OVERALL WINNER: Player 1 - {results['player1']}"
+        elif total_p2_wins > total_p1_wins:
+            verdict = f"🏆 OVERALL WINNER: Player 2 - {results['player2']}"
+        else:
+            verdict = "🤝 MATCH TIED"
+
+        append(
+            f"MATCH RESULT:\n"
+            f"  Player 1 (Circle) wins: {total_p1_wins}\n"
+            f"  Player 2 (Square) wins: {total_p2_wins}\n"
+            f"  Draws: {total_draws}\n"
+            f"  Errors: {total_errors}\n\n"
+            f"{verdict}\n"
+            f"\n{'=' * 80}\n"
+            f"DETAILED RESULTS BY BOARD SIZE\n"
+            f"{'=' * 80}\n\n")
+
+        # Detailed results for each board
+        for board_size in BOARD_SIZES:
+            winner_key, p1_key, p2_key, error_key = STANDARD_BOARD_KEYS[board_size]
+            winner = results.get(winner_key, 'error')
+            p1_score = results.get(p1_key, '')
+            p2_score = results.get(p2_key, '')
+            error_msg = results.get(error_key, '')
+
+            termination = f"  Termination: {error_msg}\n" if error_msg else ""
+            append(
+                f"{BOARD_UPPER[board_size]} BOARD:\n"
+                f"  Winner: {winner.capitalize()}\n"
+                f"  Circle Score: {p1_score if p1_score != '' else 'N/A'}\n"
+                f"  Square Score: {p2_score if p2_score != '' else 'N/A'}\n"
+                f"{termination}"
+                f"  Logs:\n"
+                f"    - Server: {board_size}_server.log\n"
+                f"    - Player 1: {board_size}_player1.log\n"
+                f"    - Player 2: {board_size}_player2.log\n\n")
+
+        append("=" * 80 + "\n")
+        
+        # Join once and write once; the buffer comfortably exceeds any
+        # report size, so the file is produced with a single syscall.
+        # Writing to a temp name and renaming keeps the summary atomic -
+        # a reader (or a resumed run) never sees a half-written report.
+        report = ''.join(parts)
+        tmp_file = summary_file.with_suffix('.txt.tmp')
+        with open(tmp_file, 'w', buffering=max(1 << 16, len(report) + 1)) as f:
+            f.write(report)
+        os.replace(tmp_file, summary_file)
+        
+        log(f"      📄 Match summary saved to: {summary_file.name}", 2)
     
-    def run_match(self, player1_dir, player2_dir, match_num):
+    def run_match(self, player1_dir, player2_dir, match_num, port):
         """Run a complete match between two players
         
         For Tournament T1:
@@ -751,7 +1201,7 @@ class TournamentRunner:
         player2_id = player2_dir.name.replace('submission_', '')
         match_name = f"match_{match_num}_{player1_id}_vs_{player2_id}"
         
-        print(f"\n🎯 Match {match_num}: {player1_dir.name} vs {player2_dir.name}")
+        log(f"\n🎯 Match {match_num}: {player1_dir.name} vs {player2_dir.name} (port {port})")
         
         # Create match directory
         match_dir = self.matches_dir / match_name
@@ -764,83 +1214,103 @@ class TournamentRunner:
             'player1_id': player1_id,
             'player2_id': player2_id,
         }
-        
+
+        # Per-match game tallies, maintained here where the winners are
+        # already in hand so the summary writer doesn't re-derive them
+        p1_wins = p2_wins = draws = game_errors = 0
+
         # Run games for each board size
-        for board_size in BOARD_SIZES:
-            if TOURNAMENT_MODE == "T1":
+        if TOURNAMENT_MODE == "T1":
+            for board_idx, board_size in enumerate(BOARD_SIZES):
                 # Tournament T1: Play twice with role swap
-                print(f"\n   📋 {board_size.upper()} BOARD - Playing 2 games with role swap")
+                log(f"\n   📋 {board_size.upper()} BOARD - Playing 2 games with role swap", 2)
                 
                 try:
                     # Game 1: player1 as circle (first move), player2 as square
-                    print(f"      🎮 Game 1: {player1_dir.name} (Circle - first move) vs {player2_dir.name} (Square)")
+                    log(f"      🎮 Game 1: {player1_dir.name} (Circle - first move) vs {player2_dir.name} (Square)", 2)
                     log_prefix = f'{board_size}_game1'
-                    winner_g1, circle_score_g1, square_score_g1, error_g1 = self.run_game(
-                        match_dir, player1_temp, player2_temp, board_size, log_prefix
+                    winner_g1, circle_score_g1, square_score_g1, error_g1 = self.run_game_cached(
+                        match_dir, player1_temp, player2_temp, board_size, log_prefix,
+                        port + 2 * board_idx, player1_id, player2_id
                     )
-                    print(f"      ✓ Game 1 completed: winner={winner_g1}, scores={circle_score_g1}-{square_score_g1}")
+                    log(f"      ✓ Game 1 completed: winner={winner_g1}, scores={circle_score_g1}-{square_score_g1}", 2)
                 except Exception as e:
-                    print(f"      ❌ Game 1 crashed with exception: {str(e)}")
-                    import traceback
-                    traceback.print_exc()
+                    log(f"      ❌ Game 1 crashed with exception: {str(e)}", 2)
+                    if VERBOSITY >= 2:
+                        traceback.print_exc()
                     winner_g1 = 'error'
                     circle_score_g1 = None
                     square_score_g1 = None
                     error_g1 = f"Exception: {str(e)[:200]}"
                 
-                # Wait for port cleanup
-                print(f"      ⏳ Waiting for port cleanup before Game 2...")
-                time.sleep(5)
-                
                 try:
                     # Game 2: player2 as circle (first move), player1 as square
-                    # Swap the player directories
-                    print(f"      🎮 Game 2: {player2_dir.name} (Circle - first move) vs {player1_dir.name} (Square)")
+                    # Swap the player directories; the fresh port means no
+                    # wait for game 1's socket to be released
+                    log(f"      🎮 Game 2: {player2_dir.name} (Circle - first move) vs {player1_dir.name} (Square)", 2)
                     log_prefix = f'{board_size}_game2'
-                    print(f"      🔧 Starting game 2 with player2_temp={player2_temp.name}, player1_temp={player1_temp.name}")
-                    winner_g2, circle_score_g2, square_score_g2, error_g2 = self.run_game(
-                        match_dir, player2_temp, player1_temp, board_size, log_prefix
+                    log(f"      🔧 Starting game 2 with player2_temp={player2_temp.name}, player1_temp={player1_temp.name}", 2)
+                    winner_g2, circle_score_g2, square_score_g2, error_g2 = self.run_game_cached(
+                        match_dir, player2_temp, player1_temp, board_size, log_prefix,
+                        port + 2 * board_idx + 1, player1_id, player2_id
                     )
-                    print(f"      ✓ Game 2 completed: winner={winner_g2}, scores={circle_score_g2}-{square_score_g2}")
+                    log(f"      ✓ Game 2 completed: winner={winner_g2}, scores={circle_score_g2}-{square_score_g2}", 2)
                 except Exception as e:
-                    print(f"      ❌ Game 2 crashed with exception: {str(e)}")
-                    import traceback
-                    traceback.print_exc()
+                    log(f"      ❌ Game 2 crashed with exception: {str(e)}", 2)
+                    if VERBOSITY >= 2:
+                        traceback.print_exc()
                     winner_g2 = 'error'
                     circle_score_g2 = None
                     square_score_g2 = None
                     error_g2 = f"Exception: {str(e)[:200]}"
                 
-                # Store results for both games
+                # Store results for both games, using the key tuples
+                # precomputed at import instead of rebuilding f-strings
+                (g1_w_key, g1_p1_key, g1_p2_key, g1_err_key,
+                 g2_w_key, g2_p1_key, g2_p2_key, g2_err_key,
+                 ow_key, t1_key, t2_key) = T1_BOARD_KEYS[board_size]
+
                 # Game 1: player1=circle, player2=square
-                results[f'{board_size}_game1_winner'] = winner_g1 or 'error'
-                results[f'{board_size}_game1_player1_score'] = circle_score_g1 if circle_score_g1 is not None else ''
-                results[f'{board_size}_game1_player2_score'] = square_score_g1 if square_score_g1 is not None else ''
-                results[f'{board_size}_game1_error'] = error_g1 or ''
-                
+                results[g1_w_key] = winner_g1 or 'error'
+                results[g1_p1_key] = circle_score_g1 if circle_score_g1 is not None else ''
+                results[g1_p2_key] = square_score_g1 if square_score_g1 is not None else ''
+                results[g1_err_key] = error_g1 or ''
+
                 # Game 2: player2=circle, player1=square
-                results[f'{board_size}_game2_winner'] = winner_g2 or 'error'
-                results[f'{board_size}_game2_player1_score'] = square_score_g2 if square_score_g2 is not None else ''  # player1 was square
-                results[f'{board_size}_game2_player2_score'] = circle_score_g2 if circle_score_g2 is not None else ''  # player2 was circle
-                results[f'{board_size}_game2_error'] = error_g2 or ''
+                results[g2_w_key] = winner_g2 or 'error'
+                results[g2_p1_key] = square_score_g2 if square_score_g2 is not None else ''  # player1 was square
+                results[g2_p2_key] = circle_score_g2 if circle_score_g2 is not None else ''  # player2 was circle
+                results[g2_err_key] = error_g2 or ''
                 
                 # Aggregate results for the board size
                 # Count wins for each player across both games
                 player1_wins = 0
                 player2_wins = 0
-                
+
                 # Game 1: player1=circle
                 if winner_g1 == 'circle':
                     player1_wins += 1
+                    p1_wins += 1
                 elif winner_g1 == 'square':
                     player2_wins += 1
-                
+                    p2_wins += 1
+                elif winner_g1 == 'draw':
+                    draws += 1
+                else:
+                    game_errors += 1
+
                 # Game 2: player2=circle
                 if winner_g2 == 'circle':
                     player2_wins += 1
+                    p2_wins += 1
                 elif winner_g2 == 'square':
                     player1_wins += 1
-                
+                    p1_wins += 1
+                elif winner_g2 == 'draw':
+                    draws += 1
+                else:
+                    game_errors += 1
+
                 # Determine overall winner for this board
                 if player1_wins > player2_wins:
                     overall_winner = 'player1'
@@ -853,26 +1323,56 @@ class TournamentRunner:
                 total_p1_score = (circle_score_g1 if circle_score_g1 is not None else 0) + (square_score_g2 if square_score_g2 is not None else 0)
                 total_p2_score = (square_score_g1 if square_score_g1 is not None else 0) + (circle_score_g2 if circle_score_g2 is not None else 0)
                 
-                results[f'{board_size}_overall_winner'] = overall_winner
-                results[f'{board_size}_player1_total_score'] = total_p1_score
-                results[f'{board_size}_player2_total_score'] = total_p2_score
-                
-            else:
-                # Standard tournament: Play once per board size
-                log_prefix = board_size
-                winner, circle_score, square_score, error = self.run_game(
-                    match_dir, player1_temp, player2_temp, board_size, log_prefix
-                )
-                
-                results[f'{board_size}_winner'] = winner or 'error'
-                results[f'{board_size}_player1_score'] = circle_score if circle_score is not None else ''
-                results[f'{board_size}_player2_score'] = square_score if square_score is not None else ''
-                results[f'{board_size}_error'] = error or ''
-            
-            # Wait between board sizes to ensure port is released
-            print(f"      ⏳ Waiting for port cleanup...")
-            time.sleep(5)
-        
+                results[ow_key] = overall_winner
+                results[t1_key] = total_p1_score
+                results[t2_key] = total_p2_score
+
+                # Preformat the display strings once while the floats are
+                # in hand; the summary writer reuses them verbatim
+                p1_str_key, p2_str_key = T1_SCORE_STR_KEYS[board_size]
+                results[p1_str_key] = f"{total_p1_score:.1f}"
+                results[p2_str_key] = f"{total_p2_score:.1f}"
+
+        else:
+            # Standard tournament: Play once per board size. The boards
+            # are independent games between the same two players, so run
+            # them concurrently - each on its own port within the match's
+            # block. Per-match wall-clock drops from the sum of the board
+            # time limits to roughly the largest one.
+            with ThreadPoolExecutor(max_workers=len(BOARD_SIZES)) as board_pool:
+                board_futures = {
+                    board_pool.submit(
+                        self.run_game_cached, match_dir, player1_temp, player2_temp,
+                        board_size, board_size, port + board_idx, player1_id, player2_id
+                    ): board_size
+                    for board_idx, board_size in enumerate(BOARD_SIZES)
+                }
+                for future in as_completed(board_futures):
+                    board_size = board_futures[future]
+                    winner, circle_score, square_score, error = future.result()
+
+                    winner_key, p1_key, p2_key, err_key = STANDARD_BOARD_KEYS[board_size]
+                    results[winner_key] = winner or 'error'
+                    results[p1_key] = circle_score if circle_score is not None else ''
+                    results[p2_key] = square_score if square_score is not None else ''
+                    results[err_key] = error or ''
+
+                    if winner == 'circle':
+                        p1_wins += 1
+                    elif winner == 'square':
+                        p2_wins += 1
+                    elif winner == 'draw':
+                        draws += 1
+                    else:
+                        game_errors += 1
+
+        # Per-match tallies (consumed by create_match_summary; not part
+        # of the CSV row, which is built positionally from csv_fields)
+        results['p1_wins'] = p1_wins
+        results['p2_wins'] = p2_wins
+        results['draws'] = draws
+        results['errors'] = game_errors
+
         # Add timestamp before creating summary
         results['timestamp'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
@@ -887,190 +1387,251 @@ class TournamentRunner:
         print(f"🏆 Starting Tournament: {self.group_name}")
         print(f"{'='*80}\n")
         
-        # Generate all matches (each pair plays once)
-        matches = list(combinations(self.submissions, 2))
-        total_matches = len(matches)
+        # Each pair plays once; count arithmetically and iterate the
+        # pairs lazily instead of materializing every tuple up front
+        n = len(self.submissions)
+        total_matches = n * (n - 1) // 2
         
         print(f"📋 Total matches to play: {total_matches}")
         print(f"🎮 Board sizes: {', '.join(BOARD_SIZES)}")
         print(f"⏱️  Time limits: Small={TIME_LIMITS['small']}s, Medium={TIME_LIMITS['medium']}s, Large={TIME_LIMITS['large']}s\n")
-        
-        # Initialize CSV with appropriate fields based on tournament mode
-        csv_fields = [
-            'match_num', 'player1', 'player2', 'player1_id', 'player2_id',
-        ]
-        
-        if TOURNAMENT_MODE == "T1":
-            # T1: Two games per board size (role swap)
-            for board_size in BOARD_SIZES:
-                csv_fields.extend([
-                    # Game 1: player1=circle, player2=square
-                    f'{board_size}_game1_winner',
-                    f'{board_size}_game1_player1_score',
-                    f'{board_size}_game1_player2_score',
-                    f'{board_size}_game1_error',
-                    # Game 2: player2=circle, player1=square
-                    f'{board_size}_game2_winner',
-                    f'{board_size}_game2_player1_score',
-                    f'{board_size}_game2_player2_score',
-                    f'{board_size}_game2_error',
-                    # Overall results for this board
-                    f'{board_size}_overall_winner',
-                    f'{board_size}_player1_total_score',
-                    f'{board_size}_player2_total_score'
-                ])
-        else:
-            # Standard: One game per board size
-            for board_size in BOARD_SIZES:
-                csv_fields.extend([
-                    f'{board_size}_winner',
-                    f'{board_size}_player1_score',
-                    f'{board_size}_player2_score',
-                    f'{board_size}_error'
-                ])
-        
-        csv_fields.append('timestamp')
-        
-        with open(self.csv_file, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=csv_fields)
-            writer.writeheader()
-        
-        # Run all matches
-        for match_num, (player1, player2) in enumerate(matches, 1):
-            try:
-                results = self.run_match(player1, player2, match_num)
+
+        # Compile every C++ submission once before matches start so
+        # parallel workers never race to build the same sources
+        self.precompile_submissions()
+
+        # CSV fields for the tournament mode (precomputed at import)
+        csv_fields = T1_CSV_FIELDS if TOURNAMENT_MODE == "T1" else STANDARD_CSV_FIELDS
+
+        # Resume support: every flushed row from an interrupted run is a
+        # finished match. Key them by (player1_id, player2_id) - match
+        # numbers are positional over combinations() and shift when the
+        # submission set changes between runs, so the pair is the only
+        # stable identity. The game-result cache makes re-runs cheap;
+        # this makes them free and keeps the CSV append-only.
+        done_pairs = set()
+        if self.use_cache and self.csv_file.exists():
+            with open(self.csv_file, newline='') as f:
+                for row in csv.DictReader(f):
+                    p1_id, p2_id = row.get('player1_id'), row.get('player2_id')
+                    if not p1_id or not p2_id:
+                        continue
+                    done_pairs.add((p1_id, p2_id))
+                    # Recovered rows count toward the live standings too
+                    self._accumulate_row(row)
+        if done_pairs:
+            log(f"⏩ Resuming: {len(done_pairs)} matches already recorded")
+
+        def pair_done(player1_dir, player2_dir):
+            pair = (player1_dir.name.replace('submission_', ''),
+                    player2_dir.name.replace('submission_', ''))
+            # A reordered submission list can flip who is player1
+            return pair in done_pairs or pair[::-1] in done_pairs
+
+        # Keep the results file open for the whole tournament with a single
+        # writer - one open/close and one header pass instead of reopening
+        # and rebuilding the writer for every finished match. Plain
+        # csv.writer with positional rows skips DictWriter's per-field
+        # dict lookup and validation on every row.
+        # Rows are flushed as they land so a crash loses at most one match.
+        # --no-cache starts the file over; otherwise it is append-only.
+        csv_mode = 'a' if self.use_cache else 'w'
+        with open(self.csv_file, csv_mode, newline='', buffering=1 << 17) as csv_f:
+            writer = csv.writer(csv_f)
+            if csv_f.tell() == 0:
+                writer.writerow(csv_fields)
+                csv_f.flush()
+
+            def record(match_num, results, completed):
                 # Timestamp already added in run_match
-                
-                # Save to CSV
-                with open(self.csv_file, 'a', newline='') as f:
-                    writer = csv.DictWriter(f, fieldnames=csv_fields)
-                    writer.writerow(results)
-                
-                print(f"✅ Match {match_num}/{total_matches} completed")
-                
-            except Exception as e:
-                print(f"❌ Match {match_num} failed: {str(e)}")
-                import traceback
-                traceback.print_exc()
+                # Save to CSV (positional row in csv_fields order)
+                writer.writerow([results.get(k, '') for k in csv_fields])
+                csv_f.flush()
+                # Fold into the running standings while the row is in
+                # hand - print_summary then has nothing left to parse
+                self._accumulate_row(results)
+                log(f"✅ Match {match_num} completed ({completed}/{total_matches})")
+
+            if self.max_workers == 1:
+                # Single worker: run matches inline. Skipping the pool
+                # avoids forking a child per match and keeps pdb/Ctrl-C
+                # usable for debugging runs (--workers 1).
+                completed = len(done_pairs)
+                for match_num, (player1, player2) in enumerate(combinations(self.submissions, 2), 1):
+                    if pair_done(player1, player2):
+                        continue
+                    try:
+                        results = self.run_match(player1, player2, match_num, match_port(match_num))
+                        completed += 1
+                        record(match_num, results, completed)
+                    except Exception as e:
+                        log(f"❌ Match {match_num} failed: {str(e)}")
+                        if VERBOSITY >= 2:
+                            traceback.print_exc()
+            else:
+                # Run matches in parallel - each match is an independent
+                # set of subprocesses on its own port, so they only
+                # contend for CPU. CSV rows are written from the parent
+                # as matches complete.
+                with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                    futures = {}
+                    for match_num, (player1, player2) in enumerate(combinations(self.submissions, 2), 1):
+                        if pair_done(player1, player2):
+                            continue
+                        port = match_port(match_num)
+                        futures[pool.submit(self.run_match, player1, player2, match_num, port)] = match_num
+
+                    completed = len(done_pairs)
+                    for future in as_completed(futures):
+                        match_num = futures[future]
+                        completed += 1
+                        try:
+                            record(match_num, future.result(), completed)
+                        except Exception as e:
+                            log(f"❌ Match {match_num} failed: {str(e)}")
+                            if VERBOSITY >= 2:
+                                traceback.print_exc()
         
         print(f"\n{'='*80}")
         print(f"🏁 Tournament Complete!")
         print(f"📊 Results saved to: {self.csv_file}")
         print(f"📁 Match logs saved to: {self.matches_dir}")
         print(f"{'='*80}\n")
-        
-        # Print summary
+
+        # Print summary (tallies were maintained as rows were recorded)
+        self._scores_live = True
         self.print_summary()
     
+    def _accumulate_row(self, result):
+        """Fold one match row (dict) into the standings tallies."""
+        # Resolve each side's tally dict once per row instead of
+        # once per counter bump. player_scores is seeded from the
+        # submissions on disk, so CSV rows naming a submission that was
+        # removed between runs are skipped - the pair-keyed resume
+        # already tolerates set changes and the recovery pass must too.
+        p1_tally = self.player_scores.get(result['player1'])
+        p2_tally = self.player_scores.get(result['player2'])
+        if p1_tally is None or p2_tally is None:
+            return
+
+        if TOURNAMENT_MODE == "T1":
+            # T1 Mode: Use overall winner and total scores
+            for board_size in BOARD_SIZES:
+                (g1_key, _, _, _, g2_key, _, _, _,
+                 ow_key, t1_key, t2_key) = T1_BOARD_KEYS[board_size]
+                p1_total = result.get(t1_key, '')
+                p2_total = result.get(t2_key, '')
+
+                outcome = T1_OUTCOMES.get(result.get(ow_key, ''))
+                if outcome:
+                    p1_tally[outcome[0]] += 1
+                    p2_tally[outcome[1]] += 1
+                else:
+                    # Check if there were errors in either game
+                    g1_winner = result.get(g1_key, 'error')
+                    g2_winner = result.get(g2_key, 'error')
+                    if g1_winner == 'error' or g2_winner == 'error':
+                        p1_tally['errors'] += 1
+                        p2_tally['errors'] += 1
+
+                # Score cells are numeric-or-empty by construction
+                # (run_match writes floats, errors leave them
+                # blank), so no try/except is needed here
+                if p1_total:
+                    p1_tally['total_score'] += float(p1_total)
+                if p2_total:
+                    p2_tally['total_score'] += float(p2_total)
+        else:
+            # Standard mode
+            for board_size in BOARD_SIZES:
+                winner_key, p1_key, p2_key, _ = STANDARD_BOARD_KEYS[board_size]
+                p1_score = result[p1_key]
+                p2_score = result[p2_key]
+
+                outcome = STANDARD_OUTCOMES.get(result[winner_key])
+                if outcome:
+                    p1_tally[outcome[0]] += 1
+                    p2_tally[outcome[1]] += 1
+                else:
+                    p1_tally['errors'] += 1
+                    p2_tally['errors'] += 1
+
+                if p1_score:
+                    p1_tally['total_score'] += float(p1_score)
+                if p2_score:
+                    p2_tally['total_score'] += float(p2_score)
+
     def print_summary(self):
         """Print tournament summary"""
-        if not self.csv_file.exists():
-            return
-        
+        if not self._scores_live:
+            # Standalone call (no tournament ran in this process) -
+            # rebuild the tallies from the CSV on disk, streaming rows
+            # straight off the reader
+            if not self.csv_file.exists():
+                return
+            with open(self.csv_file, 'r') as f:
+                for result in csv.DictReader(f):
+                    self._accumulate_row(result)
+
         print("\n📊 TOURNAMENT SUMMARY\n")
-        
-        # Read results
-        with open(self.csv_file, 'r') as f:
-            reader = csv.DictReader(f)
-            results = list(reader)
-        
-        # Calculate scores for each player
-        player_scores = {}
-        for sub in self.submissions:
-            player_scores[sub.name] = {'wins': 0, 'losses': 0, 'draws': 0, 'errors': 0, 'total_score': 0}
-        
-        for result in results:
-            player1 = result['player1']
-            player2 = result['player2']
-            
-            if TOURNAMENT_MODE == "T1":
-                # T1 Mode: Use overall winner and total scores
-                for board_size in BOARD_SIZES:
-                    overall_winner = result.get(f'{board_size}_overall_winner', '')
-                    p1_total = result.get(f'{board_size}_player1_total_score', '')
-                    p2_total = result.get(f'{board_size}_player2_total_score', '')
-                    
-                    if overall_winner == 'player1':
-                        player_scores[player1]['wins'] += 1
-                        player_scores[player2]['losses'] += 1
-                    elif overall_winner == 'player2':
-                        player_scores[player1]['losses'] += 1
-                        player_scores[player2]['wins'] += 1
-                    elif overall_winner == 'draw':
-                        player_scores[player1]['draws'] += 1
-                        player_scores[player2]['draws'] += 1
-                    else:
-                        # Check if there were errors in either game
-                        g1_winner = result.get(f'{board_size}_game1_winner', 'error')
-                        g2_winner = result.get(f'{board_size}_game2_winner', 'error')
-                        if g1_winner == 'error' or g2_winner == 'error':
-                            player_scores[player1]['errors'] += 1
-                            player_scores[player2]['errors'] += 1
-                    
-                    if p1_total:
-                        try:
-                            player_scores[player1]['total_score'] += float(p1_total)
-                        except:
-                            pass
-                    if p2_total:
-                        try:
-                            player_scores[player2]['total_score'] += float(p2_total)
-                        except:
-                            pass
-            else:
-                # Standard mode
-                for board_size in BOARD_SIZES:
-                    winner = result[f'{board_size}_winner']
-                    p1_score = result[f'{board_size}_player1_score']
-                    p2_score = result[f'{board_size}_player2_score']
-                    
-                    if winner == 'circle':
-                        player_scores[player1]['wins'] += 1
-                        player_scores[player2]['losses'] += 1
-                    elif winner == 'square':
-                        player_scores[player1]['losses'] += 1
-                        player_scores[player2]['wins'] += 1
-                    elif winner == 'draw':
-                        player_scores[player1]['draws'] += 1
-                        player_scores[player2]['draws'] += 1
-                    else:
-                        player_scores[player1]['errors'] += 1
-                        player_scores[player2]['errors'] += 1
-                    
-                    if p1_score:
-                        player_scores[player1]['total_score'] += float(p1_score)
-                    if p2_score:
-                        player_scores[player2]['total_score'] += float(p2_score)
-        
+
         # Print standings
         print(f"{'Player':<30} {'Wins':<8} {'Losses':<8} {'Draws':<8} {'Errors':<8} {'Total Score':<12}")
         print("-" * 80)
-        
-        # Sort by wins, then total score
-        sorted_players = sorted(
-            player_scores.items(),
-            key=lambda x: (x[1]['wins'], x[1]['total_score']),
-            reverse=True
-        )
-        
-        for player, stats in sorted_players:
-            print(f"{player:<30} {stats['wins']:<8} {stats['losses']:<8} {stats['draws']:<8} {stats['errors']:<8} {stats['total_score']:<12.2f}")
+
+        # Decorate into flat tuples with negated wins/score up front, so a
+        # plain sort orders best-first with no key function or reverse pass;
+        # the trailing name slot breaks ties alphabetically
+        standings = [
+            (-s['wins'], -s['total_score'], name,
+             s['losses'], s['draws'], s['errors'])
+            for name, s in self.player_scores.items()
+        ]
+        standings.sort()
+
+        for neg_wins, neg_score, player, losses, draws, errors in standings:
+            wins, total_score = -neg_wins, -neg_score
+            print(f"{player:<30} {wins:<8} {losses:<8} {draws:<8} {errors:<8} {total_score:<12.2f}")
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python run_tournament.py <group_directory> [output_directory]")
+    global VERBOSITY
+    args = sys.argv[1:]
+
+    if '-q' in args or '--quiet' in args:
+        VERBOSITY = 0
+        args = [a for a in args if a not in ('-q', '--quiet')]
+
+    # Optional --workers N to override the pool size (e.g. force 1 for
+    # serial debugging, or raise it on a big machine)
+    use_cache = True
+    if '--no-cache' in args:
+        use_cache = False
+        args.remove('--no-cache')
+
+    max_workers = MAX_PARALLEL_MATCHES
+    if '--workers' in args:
+        idx = args.index('--workers')
+        try:
+            max_workers = max(1, int(args[idx + 1]))
+        except (IndexError, ValueError):
+            print("❌ Error: --workers requires an integer argument")
+            sys.exit(1)
+        del args[idx:idx + 2]
+
+    if len(args) < 1:
+        print("Usage: python run_tournament.py <group_directory> [output_directory] [--workers N] [--no-cache] [-q|--quiet]")
         print("Example: python run_tournament.py /path/to/Groups/Group1")
         sys.exit(1)
-    
-    group_dir = sys.argv[1]
-    output_dir = sys.argv[2] if len(sys.argv) > 2 else './tournament_results'
-    
+
+    group_dir = args[0]
+    output_dir = args[1] if len(args) > 1 else './tournament_results'
+
     if not os.path.exists(group_dir):
         print(f"❌ Error: Group directory not found: {group_dir}")
         sys.exit(1)
-    
-    runner = TournamentRunner(group_dir, output_dir)
+
+    runner = TournamentRunner(group_dir, output_dir, max_workers=max_workers, use_cache=use_cache)
     runner.run_tournament()
 
 
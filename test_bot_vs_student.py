@@ -3,8 +3,20 @@
 import sys
 import requests
 import time
+import traceback
 import os
 
+# orjson decodes the nested board payload several times faster than
+# the stdlib parser; fall back to Response.json() when it is absent
+try:
+    import orjson
+
+    def load_json(resp):
+        return orjson.loads(resp.content)
+except ImportError:
+    def load_json(resp):
+        return resp.json()
+
 # Disable proxy for localhost connections
 os.environ['NO_PROXY'] = 'localhost,127.0.0.1'
 
@@ -26,35 +38,47 @@ def main():
     sys.path.insert(0, reference_agent_dir)
     from student_agent import StudentAgent
     
+    # Identical cell dicts describe the same immutable piece from turn
+    # to turn, so cache the built Piece per cell contents instead of
+    # reconstructing every occupied square on every poll
+    piece_cache = {}
+
+    def to_piece(cell):
+        key = tuple(sorted(cell.items()))
+        piece = piece_cache.get(key)
+        if piece is None:
+            if len(piece_cache) >= 4096:
+                piece_cache.clear()
+            piece = Piece.from_dict(cell)
+            piece_cache[key] = piece
+        return piece
+
     def convert_board_to_pieces(board):
-        """Convert dict-based board to Piece-based board."""
+        """Convert dict-based board to Piece-based board.
+
+        /bot/game_state always serializes cells as JSON dicts, so cells
+        are converted unconditionally - no probing for ready-made Piece
+        objects - in one comprehension pass.
+        """
         if not board or not board[0]:
             return board
-        
-        # Check if already Piece objects
-        if board[0][0] is not None and hasattr(board[0][0], 'owner'):
-            return board
-        
-        # Convert dicts to Piece objects
-        new_board = []
-        for row in board:
-            new_row = []
-            for cell in row:
-                if cell is None:
-                    new_row.append(None)
-                else:
-                    new_row.append(Piece.from_dict(cell))
-            new_board.append(new_row)
-        return new_board
+        return [[to_piece(cell) if cell is not None else None for cell in row]
+                for row in board]
     
     PLAYER = "square"
     HOST = "10.237.23.218"  # Use actual IP instead of localhost
+
+    # One keep-alive connection for the whole game - every poll reuses
+    # the same TCP socket instead of paying a fresh handshake per request
+    session = requests.Session()
+    session.mount('http://', requests.adapters.HTTPAdapter(
+        pool_connections=1, pool_maxsize=4, max_retries=0))
     
     # Connect bot (retry if server not ready)
     print(f"Connecting as {PLAYER}...")
     for attempt in range(20):
         try:
-            resp = requests.post(
+            resp = session.post(
                 f"http://{HOST}:{port}/bot/connect/{PLAYER}",
                 json={"name": "ReferenceStudent", "board_size": board_size},
                 timeout=10
@@ -79,10 +103,14 @@ def main():
     try:
         # Game loop - run until game finishes
         turn = 0
+        # Poll delay while waiting on the opponent: starts low for
+        # snappy turn handoff and backs off toward a 2s ceiling so long
+        # think times don't hammer the server with requests
+        poll_delay = 0.05
         while True:
             try:
                 # Get game state
-                state = requests.get(f"http://{HOST}:{port}/bot/game_state/{PLAYER}", timeout=10).json()
+                state = load_json(session.get(f"http://{HOST}:{port}/bot/game_state/{PLAYER}", timeout=10))
                 
                 if not state:
                     print("No game state received, waiting...")
@@ -109,9 +137,12 @@ def main():
                     break
                 
                 if not state["your_turn"]:
-                    time.sleep(1)
+                    time.sleep(poll_delay)
+                    poll_delay = min(poll_delay * 1.5, 2.0)
                     continue
                 
+                # Our turn - reset the backoff for the next wait
+                poll_delay = 0.05
                 turn += 1
                 print(f"\nTurn {turn}: Reference student turn")
                 
@@ -136,11 +167,11 @@ def main():
                     break
                 
                 # Submit move
-                resp = requests.post(
+                resp = session.post(
                     f"http://{HOST}:{port}/bot/move/{PLAYER}",
                     json={"move": move, "thinking_time": thinking_time}
                 )
-                result = resp.json()
+                result = load_json(resp)
                 
                 if not result.get("success"):
                     print(f"Move failed: {result}")
@@ -150,12 +181,9 @@ def main():
                     print(f"\n🏆 Winner: {result['winner']}")
                     break
                 
-                # Small delay before next iteration
-                time.sleep(0.5)
                 
             except Exception as e:
                 print(f"Error in game loop: {e}")
-                import traceback
                 traceback.print_exc()
                 break
     
@@ -163,7 +191,6 @@ def main():
         print("Bot interrupted by user")
     except Exception as e:
         print(f"Fatal error: {e}")
-        import traceback
         traceback.print_exc()
     
     print("\n✅ Reference student bot finished")